@@ -8,7 +8,9 @@ import sys
 from pathlib import Path
 
 # Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_ROOT_DIR = str(Path(__file__).parent.parent)
+if _ROOT_DIR not in sys.path:
+    sys.path.insert(0, _ROOT_DIR)
 
 # ----- PySide6 Modules-----
 from PySide6.QtWidgets import QApplication, QPushButton, QVBoxLayout, QWidget
@@ -16,6 +18,7 @@ from PySide6.QtWidgets import QApplication, QPushButton, QVBoxLayout, QWidget
 # ----- UI Modules-----
 from src.ui import (
     FileDialog,
+    FileDialogStyle,
     open_file_dialog,
     save_file_dialog,
     select_directory_dialog,
@@ -134,7 +137,8 @@ class FileDialogDemo(QWidget):
 
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyle(FileDialogStyle())
 
     demo = FileDialogDemo()
     demo.show()
@@ -4,10 +4,13 @@ Demonstrates different popup styles and configurations.
 """
 
 import sys
+from functools import partial
 from pathlib import Path
 
 # Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_ROOT_DIR = str(Path(__file__).parent.parent)
+if _ROOT_DIR not in sys.path:
+    sys.path.insert(0, _ROOT_DIR)
 
 from PySide6.QtWidgets import QApplication, QPushButton, QVBoxLayout, QWidget
 
@@ -122,8 +125,8 @@ class PopupDemo(QWidget):
         )
 
         # Connect signals to handle user choice
-        popup.accepted.connect(lambda: print("User clicked OK"))
-        popup.cancelled.connect(lambda: print("User clicked Cancel"))
+        popup.accepted.connect(partial(print, "User clicked OK"))
+        popup.cancelled.connect(partial(print, "User clicked Cancel"))
 
         popup.exec()
 
@@ -138,10 +141,15 @@ class PopupDemo(QWidget):
         )
 
         # Connect to custom signal
-        popup.custom_signal.connect(lambda label: print(f"User selected: {label}"))
+        popup.custom_signal.connect(self.on_custom_option_selected)
 
         popup.exec()
 
+    @staticmethod
+    def on_custom_option_selected(label: str) -> None:
+        """Print the custom button chosen in the custom buttons popup."""
+        print(f"User selected: {label}")
+
     def show_no_icon_popup(self) -> None:
         """Show a popup without an icon."""
         popup = PopupWindow(
@@ -167,7 +175,7 @@ class PopupDemo(QWidget):
 
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    app = QApplication.instance() or QApplication(sys.argv)
 
     # Apply Tokyo Night theme
     app.setStyleSheet(build_stylesheet())
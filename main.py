@@ -11,10 +11,10 @@ import sys
 from PySide6.QtWidgets import QApplication, QSystemTrayIcon
 
 # ----- Core Modules-----
-from src.core.config import APP_NAME, Config
+from src.core.config import APP_NAME, APP_ORG, Config
 
 # ----- UI Modules-----
-from src.ui import MainWindow
+from src.ui import FileDialogStyle, MainWindow
 from src.ui.styles.build_styles import build_stylesheet
 
 # ----- Utils Modules-----
@@ -23,13 +23,16 @@ from src.utils import get_icon
 
 def main():
     """Main entry point for the application."""
-    app = QApplication(sys.argv)
+    app = QApplication.instance() or QApplication(sys.argv)
     app.setApplicationName(APP_NAME)
-    app.setOrganizationName(APP_NAME.replace(" ", ""))
+    app.setOrganizationName(APP_ORG)
 
     # Set application icon
     app.setWindowIcon(get_icon("application/obsidian_forge.svg"))
 
+    # Theme the toolbar icons of every file dialog
+    app.setStyle(FileDialogStyle())
+
     # Apply stylesheet to entire application
     app.setStyleSheet(build_stylesheet())
 
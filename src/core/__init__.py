@@ -3,6 +3,7 @@
 from src.core.config import (
     ANIMATION_DURATION,
     APP_NAME,
+    APP_ORG,
     APP_VERSION,
     AUTHOR,
     BORDER_RADIUS,
@@ -38,6 +39,7 @@ __all__: list[str] = [
     "ScriptExecutor",
     "ANIMATION_DURATION",
     "APP_NAME",
+    "APP_ORG",
     "APP_VERSION",
     "AUTHOR",
     "DESCRIPTION",
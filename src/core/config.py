@@ -4,16 +4,44 @@ Handles settings for vault path, Node.js path, and Tokyo Night theme configurati
 """
 
 # ----- Built-In Modules-----
+import copy
+import getpass
 import json
 import os
+import pickle
+import shutil
 import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
+# ----- Third-Party Modules-----
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: dict) -> bytes:
+        """Serialize settings to indented UTF-8 JSON."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data: dict) -> bytes:
+        """Serialize settings to indented UTF-8 JSON."""
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 # ══════════════════════════════════════════════════════════════════
 # APPLICATION METADATA
 # ══════════════════════════════════════════════════════════════════
 APP_NAME = "Obsidian Forge"
+APP_ORG = APP_NAME.replace(" ", "")
 APP_VERSION = "1.0.0"
 AUTHOR = "Aaqil"
 DESCRIPTION = "A powerful companion for Obsidian that lets you\nquickly add content to your daily and weekly notes\nusing your existing QuickAdd scripts."
@@ -22,6 +50,7 @@ WEBSITE_URL = "https://github.com/Aaqil101/Obsidian-Forge"
 # ══════════════════════════════════════════════════════════════════
 # VAULT PATHS
 # ══════════════════════════════════════════════════════════════════
+SCRIPTS_PATH = "98 - Organize/Scripts"
 DAILY_SCRIPTS_PATH = "98 - Organize/Scripts/Add to Daily Note"
 DAILY_JOURNAL_PATH = "01 - Journal/Daily"
 WEEKLY_SCRIPTS_PATH = "98 - Organize/Scripts/Add to Weekly Note"
@@ -65,15 +94,201 @@ SPACING_LARGE = 16
 ANIMATION_DURATION = 200  # milliseconds
 HOVER_DURATION = 150  # milliseconds
 
+# ══════════════════════════════════════════════════════════════════
+# DEFAULT SETTINGS
+# ══════════════════════════════════════════════════════════════════
+DEFAULT_EXCLUDED_DIRECTORIES = (".obsidian", ".space", ".trash")
+
+_DEFAULT_SETTINGS = MappingProxyType(
+    {
+        "vault_path": "",
+        "nodejs_path": "node",  # Default to 'node' in PATH
+        "enable_animations": True,
+        "custom_daily_scripts_path": "",
+        "custom_daily_journal_path": "",
+        "custom_weekly_scripts_path": "",
+        "custom_weekly_journal_path": "",
+        "custom_utils_scripts_path": "",
+        "custom_time_path": "",
+        "excluded_directories": DEFAULT_EXCLUDED_DIRECTORIES,
+        "start_minimized": False,
+        "enable_autostart": False,
+        # Media Library settings
+        "media_library_port": 5555,
+        "custom_books_path": "",
+        "custom_youtube_path": "",
+        "custom_movies_path": "",
+        "custom_tv_shows_path": "",
+        "custom_documentaries_path": "",
+    }
+)
+
+# How long a vault directory probe stays valid, in seconds
+VAULT_PROBE_TTL = 2.0
+
+# How long a vault folder scan is reused, in seconds. Nested folder changes
+# don't touch the vault root's mtime, so only this bounds how stale it gets.
+VAULT_SCAN_TTL = 5.0
+
+# Characters in the login name that are replaced with "_" in the settings key
+_USERNAME_SANITIZE: dict[int, str] = str.maketrans({" ": "_", "\\": "_", "/": "_"})
+
+# Sanitized login name, used as this user's key in the shared settings file
+_USERNAME: str = getpass.getuser().translate(_USERNAME_SANITIZE)
+
+# Parsed settings file shared by all Config instances, keyed by file stat
+_SETTINGS_CACHE: dict = {"key": None, "data": None}
+
+
+def _settings_cache_key(config_file: Path) -> tuple[str, int, int]:
+    """Build the cache key for the settings file from a single stat call."""
+    stat = config_file.stat()
+    return (str(config_file), stat.st_mtime_ns, stat.st_size)
+
+
+def _read_settings_pickle(cache_file: Path, cache_key: tuple) -> Optional[dict]:
+    """Return the pickled settings if the sidecar was built for cache_key."""
+    try:
+        with cache_file.open("rb") as f:
+            if pickle.load(f) != cache_key:
+                return None
+            return pickle.load(f)
+    except Exception:
+        # Missing, stale or corrupt sidecar; the caller re-parses the JSON
+        return None
+
+
+def _write_settings_pickle(cache_file: Path, cache_key: tuple, data: dict) -> None:
+    """Store parsed settings next to the JSON file, tagged with its stat key."""
+    try:
+        with cache_file.open("wb") as f:
+            pickle.dump(cache_key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        print(f"Error writing settings cache: {e}")
+
+
+def _parse_version(version: object) -> int:
+    """Return the settings save counter, converting legacy "1.N" strings to N."""
+    if isinstance(version, int):
+        return version
+    try:
+        return int(str(version).rpartition(".")[2])
+    except ValueError:
+        return 0
+
+
+# Runs Node.js probes off the UI thread
+_NODE_PROBE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="node-probe"
+)
+
+
+def _run_node_version(nodejs_path: str) -> bool:
+    """Check whether the given Node.js executable runs.
+
+    Only used when shutil.which can't resolve the path; anything that isn't
+    an existing file can't run either, so no process is spawned for it.
+    """
+    if not os.path.isfile(nodejs_path):
+        return False
+    try:
+        subprocess.run(
+            [nodejs_path, "--version"],
+            capture_output=True,
+            check=True,
+            timeout=5,
+        )
+    except (
+        subprocess.CalledProcessError,
+        subprocess.TimeoutExpired,
+        OSError,  # e.g. not an executable, or no permission to run it
+    ):
+        return False
+    return True
+
+
+def _walk_folders(vault_path: str, excluded: frozenset[str]) -> list[str]:
+    """Collect "/"-joined folder paths below vault_path.
+
+    A folder is skipped, together with everything under it, when either its
+    name or its path relative to the vault root is in excluded. Symlinked
+    folders are listed by os.scandir but never followed, as with os.walk.
+    """
+    # A plain name also covers the top-level path of the same name, so only
+    # entries containing "/" need checking against the relative path
+    excluded_names: frozenset[str] = frozenset(e for e in excluded if "/" not in e)
+    excluded_paths: frozenset[str] = excluded - excluded_names
+
+    folders: list[str] = []
+    pending: list[tuple[str, str]] = [(vault_path, "")]
+
+    while pending:
+        dir_path, rel_prefix = pending.pop()
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+
+                    if entry.name in excluded_names:
+                        continue
 
-class Config:
-    """Configuration manager for application settings."""
+                    rel_path: str = rel_prefix + entry.name
+                    if excluded_paths and rel_path in excluded_paths:
+                        continue
+
+                    folders.append(rel_path)
+                    pending.append((entry.path, rel_path + "/"))
+        except OSError:
+            # Unreadable folders are skipped, matching os.walk
+            continue
+
+    return folders
+
+
+@lru_cache(maxsize=8)
+def _scan_vault_cached(
+    vault_path: str, excluded: frozenset[str], mtime_ns: int, period: int
+) -> tuple[str, ...]:
+    """Sorted vault folders, memoized on the root's mtime and a time period.
+
+    mtime_ns and period are only part of the cache key: adding, removing or
+    renaming a top-level folder changes mtime_ns and forces a fresh walk, and
+    period moves on every VAULT_SCAN_TTL seconds so nested changes show up too.
+    """
+    return tuple(sorted(_walk_folders(vault_path, excluded)))
 
-    def __init__(self) -> None:
-        # Get username and sanitize it
-        self.username: str = (
-            os.getlogin().replace(" ", "_").replace("\\", "_").replace("/", "_")
-        )
+
+class Config:
+    """Configuration manager for application settings.
+
+    Every ``Config()`` call returns the same instance, and the settings file is
+    only read on first access. The instance is shared per imported module: the
+    media server imports this file as ``core.config`` and so has its own, which
+    calls reload_if_changed to pick up settings saved by the app.
+    """
+
+    _instance: Optional["Config"] = None
+    _instance_lock: threading.Lock = threading.Lock()
+
+    def __new__(cls) -> "Config":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance: Config = super().__new__(cls)
+                    instance._setup()
+                    cls._instance = instance
+        return cls._instance
+
+    @classmethod
+    def instance(cls) -> "Config":
+        """Return the shared Config instance, creating it on first use."""
+        return cls()
+
+    def _setup(self) -> None:
+        """Initialise paths once; settings are loaded lazily."""
+        self.username: str = _USERNAME
 
         # Use %APPDATA%/Obsidian Forge/ directory
         appdata = os.getenv("APPDATA")
@@ -85,85 +300,150 @@ class Config:
 
         # Single shared config file
         self.config_file: Path = self.config_dir / "settings.json"
-        self.all_settings = self._load_all_settings()
-        self.settings = self.all_settings["users"].get(
-            self.username, self._default_settings()
-        )
+        # Pickled copy of the parsed settings, reused across app restarts
+        self.cache_file: Path = self.config_dir / "settings.cache.pkl"
+        self._vault_probe: Optional[tuple[str, float, Optional[frozenset[str]]]] = None
+        self._vault_root_cache: Optional[tuple[str, Path]] = None
+        self._saved_settings: Optional[dict] = None
+        # Stat key of settings.json when all_settings was loaded or last written
+        self._settings_key: Optional[tuple[str, int, int]] = None
+        # Node.js probes keyed by (executable, PATH) for the singleton's lifetime
+        self._node_probes: dict[tuple[str, str], Future] = {}
+
+    @cached_property
+    def all_settings(self) -> dict:
+        """Settings for every user, read from disk on first access."""
+        return self._load_all_settings()
+
+    @cached_property
+    def settings(self) -> dict:
+        """Current user's settings, created with defaults if missing."""
+        users: dict = self.all_settings["users"]
 
         # Ensure current user exists in settings
-        if self.username not in self.all_settings["users"]:
-            self.all_settings["users"][self.username] = self.settings
-            self.save_settings()
+        if self.username not in users:
+            users[self.username] = self._default_settings()
+            self._write_all_settings()
+        else:
+            # Fill in keys added since the file was written, so the property
+            # getters can index the dict directly
+            for key, value in self._default_settings().items():
+                users[self.username].setdefault(key, value)
+
+        settings: dict = users[self.username]
+        # Snapshot of the stored values, so save_settings can skip no-op writes
+        self._saved_settings = copy.deepcopy(settings)
+        return settings
 
     def _load_all_settings(self) -> dict:
-        """Load all settings from shared config file."""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    # Ensure structure exists
-                    if "users" not in data:
-                        return self._create_new_config_structure()
-                    if "version" not in data:
-                        data["version"] = "1.0"
-                    return data
-            except Exception as e:
-                print(f"Error loading config: {e}")
-                return self._create_new_config_structure()
-        return self._create_new_config_structure()
+        """Load all settings from shared config file.
+
+        The parsed file is cached at module level and in a pickle sidecar,
+        and is only re-parsed when its modification time or size changes.
+        """
+        try:
+            cache_key = _settings_cache_key(self.config_file)
+        except OSError:
+            self._settings_key = None
+            return self._create_new_config_structure()
+        self._settings_key = cache_key
+
+        if _SETTINGS_CACHE["key"] != cache_key:
+            data = _read_settings_pickle(self.cache_file, cache_key)
+            if data is None:
+                try:
+                    data = _json_loads(self.config_file.read_bytes())
+                except Exception as e:
+                    print(f"Error loading config: {e}")
+                    return self._create_new_config_structure()
+                _write_settings_pickle(self.cache_file, cache_key, data)
+            _SETTINGS_CACHE["key"] = cache_key
+            _SETTINGS_CACHE["data"] = data
+
+        # Each instance gets its own copy so unsaved edits stay local
+        data = copy.deepcopy(_SETTINGS_CACHE["data"])
+
+        # Ensure structure exists
+        if not isinstance(data, dict) or "users" not in data:
+            return self._create_new_config_structure()
+        data["version"] = _parse_version(data.get("version", 0))
+        return data
 
     def _create_new_config_structure(self) -> dict:
         """Create new config structure with version and users."""
-        return {"version": "1.0", "users": {}}
+        return {"version": 0, "users": {}}
 
     def _default_settings(self) -> dict:
         """Return default settings."""
-        return {
-            "vault_path": "",
-            "nodejs_path": "node",  # Default to 'node' in PATH
-            "enable_animations": True,
-            "custom_daily_scripts_path": "",
-            "custom_daily_journal_path": "",
-            "custom_weekly_scripts_path": "",
-            "custom_weekly_journal_path": "",
-            "custom_utils_scripts_path": "",
-            "custom_time_path": "",
-            "excluded_directories": [".obsidian", ".space", ".trash"],
-            "start_minimized": False,
-            "enable_autostart": False,
-            # Media Library settings
-            "media_library_port": 5555,
-            "custom_books_path": "",
-            "custom_youtube_path": "",
-            "custom_movies_path": "",
-            "custom_tv_shows_path": "",
-            "custom_documentaries_path": "",
-        }
+        settings = dict(_DEFAULT_SETTINGS)
+        # Give each user their own list so edits never reach the template
+        settings["excluded_directories"] = list(DEFAULT_EXCLUDED_DIRECTORIES)
+        return settings
+
+    def reload_if_changed(self) -> bool:
+        """Drop the loaded settings if settings.json changed since they were read.
+
+        They are read again on next access. Unsaved edits are discarded, so
+        this is meant for readers that never save, such as the media server.
+
+        Returns:
+            True if the settings will be reloaded.
+        """
+        if "all_settings" not in self.__dict__:
+            return False
+
+        try:
+            cache_key = _settings_cache_key(self.config_file)
+        except OSError:
+            cache_key = None
+        if cache_key == self._settings_key:
+            return False
+
+        self.__dict__.pop("all_settings", None)
+        self.__dict__.pop("settings", None)
+        return True
 
     def _increment_version(self) -> None:
         """Increment the version number."""
-        try:
-            current = self.all_settings.get("version", "1.0")
-            major, minor = current.split(".")
-            minor = str(int(minor) + 1)
-            self.all_settings["version"] = f"{major}.{minor}"
-        except Exception:
-            # If version parsing fails, just increment a counter
-            self.all_settings["version"] = "1.0"
+        self.all_settings["version"] += 1
 
     def save_settings(self) -> bool:
-        """Save current settings to shared config file."""
-        try:
-            # Update current user's settings in the all_settings structure
-            self.all_settings["users"][self.username] = self.settings
+        """Save current settings to shared config file.
+
+        Nothing is written when the settings are unchanged since they were
+        last loaded or saved.
+        """
+        settings: dict = self.settings
+        if settings == self._saved_settings:
+            return True
 
+        # Update current user's settings in the all_settings structure
+        self.all_settings["users"][self.username] = settings
+        if not self._write_all_settings():
+            return False
+
+        self._saved_settings = copy.deepcopy(settings)
+        return True
+
+    def _write_all_settings(self) -> bool:
+        """Write all_settings to disk, bumping the config version."""
+        try:
             # Increment version on each save
             self._increment_version()
 
-            # Save to file
+            # Save to a temp file first and swap it in, so a crash mid-write
+            # never leaves a truncated settings file behind
             self.config_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(self.all_settings, f, indent=2)
+            temp_file: Path = self.config_file.with_suffix(".tmp")
+            temp_file.write_bytes(_json_dumps(self.all_settings))
+            os.replace(temp_file, self.config_file)
+
+            # Keep the shared cache in sync so later loads skip parsing
+            cache_key = _settings_cache_key(self.config_file)
+            self._settings_key = cache_key
+            _SETTINGS_CACHE["key"] = cache_key
+            _SETTINGS_CACHE["data"] = copy.deepcopy(self.all_settings)
+            _write_settings_pickle(self.cache_file, cache_key, self.all_settings)
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -172,7 +452,7 @@ class Config:
     @property
     def vault_path(self) -> str:
         """Get vault path."""
-        return self.settings.get("vault_path", "")
+        return self.settings["vault_path"]
 
     @vault_path.setter
     def vault_path(self, path: str) -> None:
@@ -182,17 +462,24 @@ class Config:
     @property
     def nodejs_path(self) -> str:
         """Get Node.js path."""
-        return self.settings.get("nodejs_path", "node")
+        return self.settings["nodejs_path"]
 
     @nodejs_path.setter
     def nodejs_path(self, path: str) -> None:
         """Set Node.js path."""
+        if path != self.nodejs_path:
+            # Let failed probes run again, e.g. after Node.js was installed
+            self._node_probes = {
+                key: probe
+                for key, probe in self._node_probes.items()
+                if not probe.done() or (probe.exception() is None and probe.result())
+            }
         self.settings["nodejs_path"] = path
 
     @property
     def custom_daily_scripts_path(self) -> str:
         """Get custom daily scripts path."""
-        return self.settings.get("custom_daily_scripts_path", "")
+        return self.settings["custom_daily_scripts_path"]
 
     @custom_daily_scripts_path.setter
     def custom_daily_scripts_path(self, path: str) -> None:
@@ -202,7 +489,7 @@ class Config:
     @property
     def custom_daily_journal_path(self) -> str:
         """Get custom daily journal path."""
-        return self.settings.get("custom_daily_journal_path", "")
+        return self.settings["custom_daily_journal_path"]
 
     @custom_daily_journal_path.setter
     def custom_daily_journal_path(self, path: str) -> None:
@@ -212,7 +499,7 @@ class Config:
     @property
     def custom_weekly_scripts_path(self) -> str:
         """Get custom weekly scripts path."""
-        return self.settings.get("custom_weekly_scripts_path", "")
+        return self.settings["custom_weekly_scripts_path"]
 
     @custom_weekly_scripts_path.setter
     def custom_weekly_scripts_path(self, path: str) -> None:
@@ -222,7 +509,7 @@ class Config:
     @property
     def custom_weekly_journal_path(self) -> str:
         """Get custom weekly journal path."""
-        return self.settings.get("custom_weekly_journal_path", "")
+        return self.settings["custom_weekly_journal_path"]
 
     @custom_weekly_journal_path.setter
     def custom_weekly_journal_path(self, path: str) -> None:
@@ -232,7 +519,7 @@ class Config:
     @property
     def custom_utils_scripts_path(self) -> str:
         """Get custom utils scripts path."""
-        return self.settings.get("custom_utils_scripts_path", "")
+        return self.settings["custom_utils_scripts_path"]
 
     @custom_utils_scripts_path.setter
     def custom_utils_scripts_path(self, path: str) -> None:
@@ -242,7 +529,7 @@ class Config:
     @property
     def custom_time_path(self) -> str:
         """Get custom time path."""
-        return self.settings.get("custom_time_path", "")
+        return self.settings["custom_time_path"]
 
     @custom_time_path.setter
     def custom_time_path(self, path: str) -> None:
@@ -252,9 +539,7 @@ class Config:
     @property
     def excluded_directories(self) -> list[str]:
         """Get excluded directories list."""
-        return self.settings.get(
-            "excluded_directories", [".obsidian", ".space", ".trash"]
-        )
+        return self.settings["excluded_directories"]
 
     @excluded_directories.setter
     def excluded_directories(self, directories: list[str]) -> None:
@@ -264,7 +549,7 @@ class Config:
     @property
     def start_minimized(self) -> bool:
         """Get start minimized setting."""
-        return self.settings.get("start_minimized", False)
+        return self.settings["start_minimized"]
 
     @start_minimized.setter
     def start_minimized(self, value: bool) -> None:
@@ -274,66 +559,69 @@ class Config:
     @property
     def enable_autostart(self) -> bool:
         """Get enable autostart setting."""
-        return self.settings.get("enable_autostart", False)
+        return self.settings["enable_autostart"]
 
     @enable_autostart.setter
     def enable_autostart(self, value: bool) -> None:
         """Set enable autostart setting."""
         self.settings["enable_autostart"] = value
 
+    def _vault_root(self) -> Optional[Path]:
+        """Return the vault path as a Path, parsed once per vault_path value."""
+        vault_path: str = self.vault_path
+        if not vault_path:
+            return None
+        if self._vault_root_cache is None or self._vault_root_cache[0] != vault_path:
+            self._vault_root_cache = (vault_path, Path(vault_path))
+        return self._vault_root_cache[1]
+
     def get_daily_scripts_path(self) -> Optional[Path]:
         """Get full path to daily scripts directory."""
-        if not self.vault_path:
+        vault_root: Optional[Path] = self._vault_root()
+        if vault_root is None:
             return None
         # Use custom path if set, otherwise use default
-        if self.custom_daily_scripts_path:
-            return Path(self.vault_path) / self.custom_daily_scripts_path
-        return Path(self.vault_path) / DAILY_SCRIPTS_PATH
+        return vault_root / (self.custom_daily_scripts_path or DAILY_SCRIPTS_PATH)
 
     def get_daily_journal_path(self) -> Optional[Path]:
         """Get full path to daily journal directory."""
-        if not self.vault_path:
+        vault_root: Optional[Path] = self._vault_root()
+        if vault_root is None:
             return None
         # Use custom path if set, otherwise use default
-        if self.custom_daily_journal_path:
-            return Path(self.vault_path) / self.custom_daily_journal_path
-        return Path(self.vault_path) / DAILY_JOURNAL_PATH
+        return vault_root / (self.custom_daily_journal_path or DAILY_JOURNAL_PATH)
 
     def get_weekly_scripts_path(self) -> Optional[Path]:
         """Get full path to weekly scripts directory."""
-        if not self.vault_path:
+        vault_root: Optional[Path] = self._vault_root()
+        if vault_root is None:
             return None
         # Use custom path if set, otherwise use default
-        if self.custom_weekly_scripts_path:
-            return Path(self.vault_path) / self.custom_weekly_scripts_path
-        return Path(self.vault_path) / WEEKLY_SCRIPTS_PATH
+        return vault_root / (self.custom_weekly_scripts_path or WEEKLY_SCRIPTS_PATH)
 
     def get_weekly_journal_path(self) -> Optional[Path]:
         """Get full path to weekly journal directory."""
-        if not self.vault_path:
+        vault_root: Optional[Path] = self._vault_root()
+        if vault_root is None:
             return None
         # Use custom path if set, otherwise use default
-        if self.custom_weekly_journal_path:
-            return Path(self.vault_path) / self.custom_weekly_journal_path
-        return Path(self.vault_path) / WEEKLY_JOURNAL_PATH
+        return vault_root / (self.custom_weekly_journal_path or WEEKLY_JOURNAL_PATH)
 
     def get_utils_scripts_path(self) -> Optional[Path]:
         """Get full path to utils scripts directory."""
-        if not self.vault_path:
+        vault_root: Optional[Path] = self._vault_root()
+        if vault_root is None:
             return None
         # Use custom path if set, otherwise use default
-        if self.custom_utils_scripts_path:
-            return Path(self.vault_path) / self.custom_utils_scripts_path
-        return Path(self.vault_path) / UTILS_SCRIPTS_PATH
+        return vault_root / (self.custom_utils_scripts_path or UTILS_SCRIPTS_PATH)
 
     def get_time_path(self) -> Optional[Path]:
         """Get full path to time file."""
-        if not self.vault_path:
+        vault_root: Optional[Path] = self._vault_root()
+        if vault_root is None:
             return None
         # Use custom path if set, otherwise use default
-        if self.custom_time_path:
-            return Path(self.vault_path) / self.custom_time_path
-        return Path(self.vault_path) / TIME_PATH
+        return vault_root / (self.custom_time_path or TIME_PATH)
 
     # ══════════════════════════════════════════════════════════════════
     # MEDIA LIBRARY PROPERTIES
@@ -342,7 +630,7 @@ class Config:
     @property
     def media_library_port(self) -> int:
         """Get media library server port."""
-        return self.settings.get("media_library_port", 5555)
+        return self.settings["media_library_port"]
 
     @media_library_port.setter
     def media_library_port(self, port: int) -> None:
@@ -352,7 +640,7 @@ class Config:
     @property
     def custom_books_path(self) -> str:
         """Get custom books path."""
-        return self.settings.get("custom_books_path", "")
+        return self.settings["custom_books_path"]
 
     @custom_books_path.setter
     def custom_books_path(self, path: str) -> None:
@@ -362,7 +650,7 @@ class Config:
     @property
     def custom_youtube_path(self) -> str:
         """Get custom YouTube path."""
-        return self.settings.get("custom_youtube_path", "")
+        return self.settings["custom_youtube_path"]
 
     @custom_youtube_path.setter
     def custom_youtube_path(self, path: str) -> None:
@@ -372,7 +660,7 @@ class Config:
     @property
     def custom_movies_path(self) -> str:
         """Get custom movies path."""
-        return self.settings.get("custom_movies_path", "")
+        return self.settings["custom_movies_path"]
 
     @custom_movies_path.setter
     def custom_movies_path(self, path: str) -> None:
@@ -382,7 +670,7 @@ class Config:
     @property
     def custom_tv_shows_path(self) -> str:
         """Get custom TV shows path."""
-        return self.settings.get("custom_tv_shows_path", "")
+        return self.settings["custom_tv_shows_path"]
 
     @custom_tv_shows_path.setter
     def custom_tv_shows_path(self, path: str) -> None:
@@ -392,7 +680,7 @@ class Config:
     @property
     def custom_documentaries_path(self) -> str:
         """Get custom documentaries path."""
-        return self.settings.get("custom_documentaries_path", "")
+        return self.settings["custom_documentaries_path"]
 
     @custom_documentaries_path.setter
     def custom_documentaries_path(self, path: str) -> None:
@@ -401,43 +689,38 @@ class Config:
 
     def get_books_path(self) -> Optional[Path]:
         """Get full path to books directory."""
-        if not self.vault_path:
+        vault_root: Optional[Path] = self._vault_root()
+        if vault_root is None:
             return None
-        if self.custom_books_path:
-            return Path(self.vault_path) / self.custom_books_path
-        return Path(self.vault_path) / BOOKS
+        return vault_root / (self.custom_books_path or BOOKS)
 
     def get_youtube_path(self) -> Optional[Path]:
         """Get full path to YouTube directory."""
-        if not self.vault_path:
+        vault_root: Optional[Path] = self._vault_root()
+        if vault_root is None:
             return None
-        if self.custom_youtube_path:
-            return Path(self.vault_path) / self.custom_youtube_path
-        return Path(self.vault_path) / YOUTUBE
+        return vault_root / (self.custom_youtube_path or YOUTUBE)
 
     def get_movies_path(self) -> Optional[Path]:
         """Get full path to movies directory."""
-        if not self.vault_path:
+        vault_root: Optional[Path] = self._vault_root()
+        if vault_root is None:
             return None
-        if self.custom_movies_path:
-            return Path(self.vault_path) / self.custom_movies_path
-        return Path(self.vault_path) / MOVIES
+        return vault_root / (self.custom_movies_path or MOVIES)
 
     def get_tv_shows_path(self) -> Optional[Path]:
         """Get full path to TV shows directory."""
-        if not self.vault_path:
+        vault_root: Optional[Path] = self._vault_root()
+        if vault_root is None:
             return None
-        if self.custom_tv_shows_path:
-            return Path(self.vault_path) / self.custom_tv_shows_path
-        return Path(self.vault_path) / TV_SHOWS
+        return vault_root / (self.custom_tv_shows_path or TV_SHOWS)
 
     def get_documentaries_path(self) -> Optional[Path]:
         """Get full path to documentaries directory."""
-        if not self.vault_path:
+        vault_root: Optional[Path] = self._vault_root()
+        if vault_root is None:
             return None
-        if self.custom_documentaries_path:
-            return Path(self.vault_path) / self.custom_documentaries_path
-        return Path(self.vault_path) / DOCUMENTARIES
+        return vault_root / (self.custom_documentaries_path or DOCUMENTARIES)
 
     def scan_vault_folders(self, vault_path: str = None) -> list[str]:
         """Scan vault for all folders, excluding configured directories.
@@ -451,83 +734,120 @@ class Config:
         if vault_path is None:
             vault_path = self.vault_path
 
-        if not vault_path or not os.path.exists(vault_path):
+        if not vault_path:
             return []
 
-        folders = []
-        vault_root = Path(vault_path)
-        excluded: list[str] = self.excluded_directories
+        try:
+            mtime_ns: int = os.stat(vault_path).st_mtime_ns
+        except OSError:
+            return []
 
-        # Walk through directory tree
-        for root, dirs, files in os.walk(vault_path):
-            # Get relative path from vault root
-            rel_path: Path = Path(root).relative_to(vault_root)
-            current_path: str = str(rel_path).replace("\\", "/")
+        excluded: frozenset[str] = frozenset(self.excluded_directories)
+        period: int = int(time.monotonic() // VAULT_SCAN_TTL)
+        return list(_scan_vault_cached(vault_path, excluded, mtime_ns, period))
 
-            # Filter out excluded directories (both by name and by full path)
-            filtered_dirs = []
-            for d in dirs:
-                # Check both directory name and full relative path
-                dir_rel_path: str = (
-                    f"{current_path}/{d}" if current_path != "." else d
-                ).replace("\\", "/")
+    def _probe_vault(self, vault_path: str) -> Optional[frozenset[str]]:
+        """Probe the vault and its default scripts folder in one pass.
 
-                # Exclude if matches directory name OR full relative path
-                if d not in excluded and dir_rel_path not in excluded:
-                    filtered_dirs.append(d)
+        The result is cached per vault path for VAULT_PROBE_TTL seconds, so
+        is_configured and validate_paths can share it.
 
-            dirs[:] = filtered_dirs
+        Args:
+            vault_path: Vault directory to probe.
+
+        Returns:
+            None if the vault directory does not exist, otherwise the names of
+            the directories inside the default scripts folder (empty if the
+            scripts folder itself is missing).
+        """
+        now: float = time.monotonic()
+        cached = self._vault_probe
+        if cached and cached[0] == vault_path and now - cached[1] < VAULT_PROBE_TTL:
+            return cached[2]
 
-            # Skip the root itself
-            if str(rel_path) != ".":
-                folders.append(str(rel_path).replace("\\", "/"))
+        try:
+            with os.scandir(os.path.join(vault_path, SCRIPTS_PATH)) as entries:
+                result: Optional[frozenset[str]] = frozenset(
+                    entry.name for entry in entries if entry.is_dir()
+                )
+        except OSError:
+            # Only stat the vault itself when the scripts folder is unreadable
+            result = frozenset() if os.path.isdir(vault_path) else None
 
-        return sorted(folders)
+        self._vault_probe = (vault_path, now, result)
+        return result
 
     def is_configured(self) -> bool:
         """Check if all required settings are configured."""
-        return bool(self.vault_path and os.path.exists(self.vault_path))
+        vault_path: str = self.vault_path
+        return bool(vault_path) and self._probe_vault(vault_path) is not None
 
-    def validate_paths(self) -> list[str]:
-        """Validate configured paths and return list of errors."""
-        errors = []
+    def probe_node_async(self, nodejs_path: Optional[str] = None) -> Future:
+        """Check a Node.js executable in a background thread.
 
-        if not self.vault_path:
-            errors.append("Vault path is not set")
-        elif not os.path.exists(self.vault_path):
-            errors.append(f"Vault path does not exist: {self.vault_path}")
-        else:
-            # Check if scripts directories exist
-            daily_path = self.get_daily_scripts_path()
-            if not daily_path or not daily_path.exists():
-                errors.append(
-                    f"Daily scripts directory not found: {DAILY_SCRIPTS_PATH}"
-                )
+        The probe is cached per path and PATH value until nodejs_path changes,
+        so starting it early lets validate_paths reuse the result without
+        blocking.
 
-            weekly_path = self.get_weekly_scripts_path()
-            if not weekly_path or not weekly_path.exists():
-                errors.append(
-                    f"Weekly scripts directory not found: {WEEKLY_SCRIPTS_PATH}"
-                )
+        Args:
+            nodejs_path: Executable to check. If None, uses configured nodejs_path.
 
-            utils_path = self.get_utils_scripts_path()
-            if not utils_path or not utils_path.exists():
-                errors.append(
-                    f"Utils scripts directory not found: {UTILS_SCRIPTS_PATH}"
-                )
+        Returns:
+            Future resolving to True if the executable runs.
+        """
+        if nodejs_path is None:
+            nodejs_path = self.nodejs_path
+
+        key: tuple[str, str] = (nodejs_path, os.environ.get("PATH", ""))
+        probe: Optional[Future] = self._node_probes.get(key)
+        if probe is None:
+            if shutil.which(nodejs_path):
+                # Found on PATH (or an executable file): no need to spawn it
+                probe = Future()
+                probe.set_result(True)
+            else:
+                probe = _NODE_PROBE_EXECUTOR.submit(_run_node_version, nodejs_path)
+            self._node_probes[key] = probe
+        return probe
+
+    def validate_paths(self, check_nodejs: bool = False) -> list[str]:
+        """Validate configured paths and return list of errors.
 
-        try:
-            subprocess.run(
-                [self.nodejs_path, "--version"],
-                capture_output=True,
-                check=True,
-                timeout=5,
+        Args:
+            check_nodejs: Also check that the configured Node.js executable runs.
+                The result is reused until nodejs_path changes (see probe_node_async).
+                Never waits for the check: while it is still running, that is
+                reported as an error instead.
+        """
+        errors = []
+        vault_path: str = self.vault_path
+        script_dirs = self._probe_vault(vault_path) if vault_path else None
+
+        if not vault_path:
+            errors.append("Vault path is not set")
+        elif script_dirs is None:
+            errors.append(f"Vault path does not exist: {vault_path}")
+        else:
+            checks: tuple[tuple[str, str, str], ...] = (
+                ("Daily", self.custom_daily_scripts_path, DAILY_SCRIPTS_PATH),
+                ("Weekly", self.custom_weekly_scripts_path, WEEKLY_SCRIPTS_PATH),
+                ("Utils", self.custom_utils_scripts_path, UTILS_SCRIPTS_PATH),
             )
-        except (
-            subprocess.CalledProcessError,
-            FileNotFoundError,
-            subprocess.TimeoutExpired,
-        ):
-            errors.append(f"Node.js not found or not working: {self.nodejs_path}")
+            for label, custom_path, default_path in checks:
+                if custom_path:
+                    found: bool = os.path.isdir(os.path.join(vault_path, custom_path))
+                else:
+                    found = default_path.rsplit("/", 1)[1] in script_dirs
+                if not found:
+                    errors.append(
+                        f"{label} scripts directory not found: {default_path}"
+                    )
+
+        if check_nodejs:
+            probe: Future = self.probe_node_async()
+            if not probe.done():
+                errors.append(f"Node.js is still being checked: {self.nodejs_path}")
+            elif probe.exception() is not None or not probe.result():
+                errors.append(f"Node.js not found or not working: {self.nodejs_path}")
 
         return errors
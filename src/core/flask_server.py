@@ -6,13 +6,13 @@ from PySide6.QtCore import QThread, Signal
 import socket
 import sys
 from pathlib import Path
-from werkzeug.serving import make_server
 
 # Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_SRC_DIR = str(Path(__file__).parent.parent)
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 from core.config import Config
-from web.app import create_app
 
 
 class FlaskServerThread(QThread):
@@ -27,34 +27,34 @@ class FlaskServerThread(QThread):
         self.config = config
         self.app = None
         self.server = None
+        self._shutdown_server = None
         self.port = config.media_library_port
         self._stop_requested = False
 
     def find_free_port(self, start_port: int) -> int:
         """
-        Find an available port starting from start_port.
+        Find an available port, preferring start_port.
 
         Args:
-            start_port: Port to start scanning from
+            start_port: Port to try first
 
         Returns:
-            First available port found
-
-        Raises:
-            RuntimeError: If no free port found in range
+            start_port if it is free, otherwise a port picked by the OS
         """
-        for port in range(start_port, start_port + 100):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
             try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.bind(("127.0.0.1", port))
-                    return port
+                s.bind(("127.0.0.1", start_port))
             except OSError:
-                continue
-        raise RuntimeError("No free ports available in range")
+                # Let the OS assign any free port instead of probing a range
+                s.bind(("127.0.0.1", 0))
+            return s.getsockname()[1]
 
     def run(self):
         """Run Flask server (blocks until stopped)."""
         try:
+            # Flask and the WSGI server are only loaded once the server starts
+            from web.app import create_app
+
             # Find free port
             self.port = self.find_free_port(self.config.media_library_port)
 
@@ -69,16 +69,49 @@ class FlaskServerThread(QThread):
 
             self.app = create_app(self.config.vault_path, config_dict)
 
-            # Create server using werkzeug
-            self.server = make_server(
-                "127.0.0.1", self.port, self.app, threaded=True
-            )
-
-            # Emit started signal
-            self.server_started.emit(self.port)
-
-            # Serve forever until shutdown
-            self.server.serve_forever()
+            try:
+                # Prefer waitress: a fixed worker pool instead of a thread per request
+                from waitress import create_server
+            except ImportError:
+                create_server = None
+
+            if create_server is not None:
+                self.server = create_server(
+                    self.app, host="127.0.0.1", port=self.port, threads=8
+                )
+                # Wakes the loop below so it notices _stop_requested
+                self._shutdown_server = self.server.pull_trigger
+                self.server_started.emit(self.port)
+
+                # Serve one poll at a time until stop() is requested. Closing the
+                # listening socket alone would leave keep-alive connections
+                # (e.g. an open media page) in the loop's socket map, and
+                # server.run() only returns once that map is empty.
+                while not self._stop_requested:
+                    self.server.asyncore.loop(
+                        timeout=self.server.adj.asyncore_loop_timeout,
+                        map=self.server._map,
+                        count=1,
+                    )
+
+                # Tear down on the loop's own thread: close every channel,
+                # then stop the worker threads
+                self.server.asyncore.close_all(self.server._map, ignore_all=True)
+                self.server.task_dispatcher.shutdown(timeout=1)
+            else:
+                from werkzeug.serving import make_server
+
+                # Create server using werkzeug
+                self.server = make_server(
+                    "127.0.0.1", self.port, self.app, threaded=True
+                )
+                self._shutdown_server = self.server.shutdown
+
+                # Emit started signal
+                self.server_started.emit(self.port)
+
+                # Serve forever until shutdown
+                self.server.serve_forever()
 
         except Exception as e:
             self.server_error.emit(str(e))
@@ -88,11 +121,11 @@ class FlaskServerThread(QThread):
     def stop(self):
         """Stop the Flask server gracefully."""
         self._stop_requested = True
-        if self.server:
+        if self._shutdown_server:
             try:
                 # Shutdown must be called from a different thread
                 import threading
-                shutdown_thread = threading.Thread(target=self.server.shutdown)
+                shutdown_thread = threading.Thread(target=self._shutdown_server)
                 shutdown_thread.daemon = True
                 shutdown_thread.start()
                 shutdown_thread.join(timeout=1)
@@ -4,8 +4,13 @@ Frontmatter handler for parsing and updating YAML frontmatter in daily and weekl
 
 # ----- Built-In Modules-----
 import datetime
+import math
+import re
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional
 
 # ----- Third-Party Modules-----
 from ruamel.yaml import YAML
@@ -51,6 +56,114 @@ WEEKLY_FIELDS = {
 }
 
 
+# English month names for daily-note folders; unlike strftime("%B") these
+# don't change with the process locale
+_MONTH_NAMES: tuple[str, ...] = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+# Per-thread loaders for parse_frontmatter; the Flask server parses notes from
+# several request threads and a YAML instance isn't safe to share between them
+_yaml_local = threading.local()
+
+# Characters marking inline YAML values the line rewrite must not touch
+# (comments, anchors, aliases, tags and block scalar indicators)
+_UNSAFE_INLINE: frozenset[str] = frozenset("#&*!|>")
+
+# Strings ruamel.yaml dumps unquoted: they start with a letter, can't be read
+# back as another type and contain no YAML indicators
+_PLAIN_STRING = re.compile(r"[A-Za-z](?:[A-Za-z0-9 _.,/-]*[A-Za-z0-9_.,/-])?")
+_RESERVED_WORDS: frozenset[str] = frozenset({"true", "false", "null"})
+
+# Checks a single field value, returning an error message or None
+Validator = Callable[[Any], Optional[str]]
+
+
+def _allow_any(value: Any) -> Optional[str]:
+    """Validator for fields without a schema: unknown fields are allowed."""
+    return None
+
+
+def _compile_validator(field_name: str, field_config: dict) -> Validator:
+    """
+    Build a validator for one field, resolving its schema up front.
+
+    Args:
+        field_name: Name of the field, used in error messages
+        field_config: The field's entry in DAILY_FIELDS or WEEKLY_FIELDS
+
+    Returns:
+        Function taking a value and returning an error message or None
+    """
+    field_type: str = field_config["type"]
+
+    if field_type == "bool":
+        bool_error: str = f"{field_name} must be true or false"
+
+        def validate_bool(value: Any) -> Optional[str]:
+            return None if isinstance(value, bool) else bool_error
+
+        return validate_bool
+
+    if field_type not in ("int", "float"):
+        return _allow_any
+
+    convert: type = int if field_type == "int" else float
+    min_val, max_val = field_config["range"]
+    range_error: str = f"{field_name} must be between {min_val} and {max_val}"
+    type_error: str = f"{field_name} must be a number"
+
+    def validate_number(value: Any) -> Optional[str]:
+        if value == "" or value is None:
+            return None  # Empty values are allowed
+        try:
+            number = convert(value)
+        except (ValueError, TypeError):
+            return type_error
+        return None if min_val <= number <= max_val else range_error
+
+    return validate_number
+
+
+# Validators compiled once per note type from the field schemas
+_DAILY_VALIDATORS: dict[str, Validator] = {
+    name: _compile_validator(name, config) for name, config in DAILY_FIELDS.items()
+}
+_WEEKLY_VALIDATORS: dict[str, Validator] = {
+    name: _compile_validator(name, config) for name, config in WEEKLY_FIELDS.items()
+}
+
+
+def _group_by_section(fields: dict) -> Mapping[str, tuple[str, ...]]:
+    """Group field names by their schema section, keeping schema order."""
+    sections: dict[str, list[str]] = {}
+    for field_name, field_config in fields.items():
+        sections.setdefault(field_config["section"], []).append(field_name)
+    return MappingProxyType({name: tuple(names) for name, names in sections.items()})
+
+
+# Read-only section layouts; the schemas never change at runtime
+_DAILY_SECTIONS: Mapping[str, tuple[str, ...]] = _group_by_section(DAILY_FIELDS)
+_WEEKLY_SECTIONS: Mapping[str, tuple[str, ...]] = _group_by_section(WEEKLY_FIELDS)
+
+
+@lru_cache(maxsize=12)
+def _month_folder(month: int) -> str:
+    """Return the daily-note month folder name, e.g. "01-January"."""
+    return f"{month:02d}-{_MONTH_NAMES[month - 1]}"
+
+
 def calculate_daily_note_path(vault_path: str, date: datetime.date) -> Path:
     """
     Calculate the file path for a daily note.
@@ -67,8 +180,8 @@ def calculate_daily_note_path(vault_path: str, date: datetime.date) -> Path:
         Path("/vault/01 - Journal/Daily/2026/01-January/2026-01-30.md")
     """
     year = str(date.year)
-    month_str: str = date.strftime("%m-%B")  # "01-January"
-    date_str: str = date.strftime("%Y-%m-%d")  # "2026-01-30"
+    month_str: str = _month_folder(date.month)  # "01-January"
+    date_str: str = date.isoformat()  # "2026-01-30"
 
     return Path(vault_path) / DAILY_JOURNAL_PATH / year / month_str / f"{date_str}.md"
 
@@ -94,62 +207,219 @@ def calculate_weekly_note_path(vault_path: str, date: datetime.date) -> Path:
     return Path(vault_path) / WEEKLY_JOURNAL_PATH / str(iso_year) / f"{week_str}.md"
 
 
-def parse_frontmatter(file_path: Path) -> tuple[dict, str]:
+def _split_frontmatter(content: str) -> Optional[tuple[str, str]]:
     """
-    Parse YAML frontmatter from a markdown file.
+    Locate the frontmatter block without splitting the whole file.
+
+    Args:
+        content: Full markdown file content
+
+    Returns:
+        Tuple of (yaml_str, remaining_content) such that
+        f"---{yaml_str}---{remaining_content}" == content, or None if the
+        content doesn't start with a complete frontmatter block
+    """
+    if not content.startswith("---"):
+        return None
+
+    # The closing delimiter is the next "---" at the start of a line
+    end: int = content.find("\n---", 3)
+    if end == -1:
+        return None
+
+    return content[3 : end + 1], content[end + 4 :]
+
+
+def _read_frontmatter_only(file_path: Path) -> str:
+    """
+    Read a file's frontmatter text, stopping at the closing delimiter.
 
     Args:
         file_path: Path to the markdown file
 
     Returns:
-        Tuple of (frontmatter_dict, remaining_content)
-        Returns ({}, "") if file doesn't exist or has no frontmatter
+        The same yaml_str as _split_frontmatter would return for the whole
+        file, or "" if the file has no complete frontmatter block
+    """
+    with file_path.open(encoding="utf-8") as f:
+        if f.read(3) != "---":
+            return ""
+
+        lines: list[str] = [f.readline()]
+        for line in f:
+            # The closing delimiter is the next "---" at the start of a line
+            if line.startswith("---"):
+                return "".join(lines)
+            lines.append(line)
+    return ""
+
+
+def parse_frontmatter_raw(file_path: Path, read_body: bool = True) -> tuple[str, str]:
+    """
+    Split a markdown file into raw frontmatter text and body without parsing.
+
+    Args:
+        file_path: Path to the markdown file
+        read_body: If False, stop reading at the closing delimiter and return
+            "" as the body; files that don't start with "---" are rejected
+            after reading three characters
+
+    Returns:
+        Tuple of (yaml_str, remaining_content)
+        yaml_str is "" if the file has no frontmatter, in which case
+        remaining_content is the whole file; returns ("", "") if the file
+        doesn't exist or can't be read
 
     Example:
-        >>> frontmatter, content = parse_frontmatter(Path("note.md"))
-        >>> frontmatter["mood"]
-        5
+        >>> yaml_str, content = parse_frontmatter_raw(Path("note.md"))
+        >>> yaml_str
+        "\nmood: 5\n"
     """
     if not file_path.exists():
-        return {}, ""
+        return "", ""
 
     try:
+        if not read_body:
+            return _read_frontmatter_only(file_path), ""
         content: str = file_path.read_text(encoding="utf-8")
     except Exception as e:
         print(f"Error reading file {file_path}: {e}")
-        return {}, ""
+        return "", ""
 
-    # Check for frontmatter
-    if not content.startswith("---"):
-        return {}, content
+    split: Optional[tuple[str, str]] = _split_frontmatter(content)
+    if split is None:
+        return "", content
+    return split
 
-    # Split on second --- delimiter
-    parts: list[str] = content.split("---", 2)
-    if len(parts) < 3:
-        return {}, content
 
-    yaml_str: str = parts[1]
-    remaining: str = parts[2]
+def _safe_yaml() -> YAML:
+    """Return this thread's read-only YAML loader, creating it on first use."""
+    yaml: Optional[YAML] = getattr(_yaml_local, "safe", None)
+    if yaml is None:
+        # The safe loader builds plain dicts and uses libyaml when available
+        yaml = _yaml_local.safe = YAML(typ="safe")
+    return yaml
+
+
+def parse_frontmatter(file_path: Path, read_body: bool = True) -> tuple[dict, str]:
+    """
+    Parse YAML frontmatter from a markdown file.
+
+    Args:
+        file_path: Path to the markdown file
+        read_body: If False, don't read past the frontmatter and return "" as
+            the remaining content
+
+    Returns:
+        Tuple of (frontmatter_dict, remaining_content)
+        Returns ({}, "") if file doesn't exist or has no frontmatter
+
+    Example:
+        >>> frontmatter, content = parse_frontmatter(Path("note.md"))
+        >>> frontmatter["mood"]
+        5
+    """
+    yaml_str, remaining = parse_frontmatter_raw(file_path, read_body)
+    if not yaml_str:
+        return {}, remaining
 
     try:
-        yaml = YAML()
-        yaml.preserve_quotes = True
-        yaml.default_flow_style = False
-        yaml.indent(mapping=2, sequence=2, offset=2)  # Preserve indentation style
-        frontmatter = yaml.load(yaml_str) or {}
+        frontmatter = _safe_yaml().load(yaml_str) or {}
         return frontmatter, remaining
     except Exception as e:
         print(f"Error parsing YAML frontmatter: {e}")
-        return {}, content
+        return {}, f"---{yaml_str}---{remaining}"
 
 
-def update_frontmatter(file_path: Path, updates: dict) -> bool:
+def _format_scalar(value: Any) -> Optional[str]:
+    """
+    Render a scalar exactly as ruamel.yaml dumps it in a block mapping.
+
+    Args:
+        value: Value to render
+
+    Returns:
+        YAML text for the value ("" for None), or None if it needs a full
+        YAML dump
+    """
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        if _PLAIN_STRING.fullmatch(value) and value.lower() not in _RESERVED_WORDS:
+            return value
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float) and math.isfinite(value):
+        return repr(value)
+    return None
+
+
+def _rewrite_scalar_lines(yaml_str: str, updates: dict) -> Optional[str]:
+    """
+    Apply scalar updates by rewriting their lines in the raw frontmatter.
+
+    Only top-level keys whose current value sits alone on their own line are
+    rewritten; every other byte of the frontmatter is left untouched.
+
+    Args:
+        yaml_str: Frontmatter text between the --- delimiters
+        updates: Dictionary of field updates
+
+    Returns:
+        The updated frontmatter text, or None if any update needs a full
+        YAML round-trip (new key, non-scalar value, comment, anchor, ...)
+    """
+    lines: list[str] = yaml_str.split("\n")
+
+    # Locate each updated key; top-level keys start at column 0
+    key_lines: dict[str, int] = {}
+    for number, line in enumerate(lines):
+        key, sep, _ = line.partition(":")
+        if sep and key in updates:
+            if key in key_lines:
+                return None  # Duplicate key
+            key_lines[key] = number
+
+    for key, value in updates.items():
+        number: Optional[int] = key_lines.get(key)
+        rendered: Optional[str] = _format_scalar(value)
+        if number is None or rendered is None:
+            return None
+
+        rest: str = lines[number][len(key) + 1 :]
+        current: str = rest.strip()
+        if (rest and not rest[:1].isspace()) or _UNSAFE_INLINE.intersection(current):
+            return None
+
+        # A quoted value keeps its quotes in ruamel.yaml, even for new text
+        if isinstance(value, str) and current[:1] in ("'", '"'):
+            return None
+
+        # An indented next line continues this value (multi-line scalar or
+        # nested block); after an empty value so does a "-" list item
+        next_line: str = lines[number + 1] if number + 1 < len(lines) else ""
+        if next_line[:1].isspace() or (not current and next_line[:1] == "-"):
+            return None
+
+        lines[number] = f"{key}: {rendered}" if rendered else f"{key}:"
+
+    return "\n".join(lines)
+
+
+def update_frontmatter(
+    file_path: Path, updates: dict, note_type: Optional[str] = None
+) -> bool:
     """
     Update specific frontmatter fields in a markdown file.
 
     Args:
         file_path: Path to the markdown file
         updates: Dictionary of field updates
+        note_type: "daily" or "weekly" to validate updates before touching the
+            file; None skips validation
 
     Returns:
         True if successful, False otherwise
@@ -158,6 +428,12 @@ def update_frontmatter(file_path: Path, updates: dict) -> bool:
         >>> update_frontmatter(Path("note.md"), {"mood": 8, "book": "Dune"})
         True
     """
+    if note_type is not None:
+        errors: dict[str, str] = validate_updates(updates, note_type)
+        if errors:
+            print(f"Invalid frontmatter updates: {', '.join(errors.values())}")
+            return False
+
     if not file_path.exists():
         print(f"File does not exist: {file_path}")
         return False
@@ -171,14 +447,21 @@ def update_frontmatter(file_path: Path, updates: dict) -> bool:
             print(f"No frontmatter found in {file_path}")
             return False
 
-        # Split on second --- delimiter
-        parts: list[str] = content_str.split("---", 2)
-        if len(parts) < 3:
+        split: Optional[tuple[str, str]] = _split_frontmatter(content_str)
+        if split is None:
             print(f"Invalid frontmatter format in {file_path}")
             return False
 
-        yaml_str: str = parts[1]
-        remaining: str = parts[2]
+        yaml_str, remaining = split
+
+        # Fast path: rewrite just the changed lines when every update is a
+        # plain scalar replacing an existing single-line value
+        rewritten: Optional[str] = _rewrite_scalar_lines(yaml_str, updates)
+        if rewritten is not None:
+            new_content: str = f"---{rewritten}---{remaining}"
+            if new_content != content_str:
+                file_path.write_text(new_content, encoding="utf-8")
+            return True
 
         # Load and update frontmatter using ruamel.yaml (preserves formatting)
         yaml = YAML()
@@ -205,7 +488,7 @@ def update_frontmatter(file_path: Path, updates: dict) -> bool:
         # Remove trailing newline to avoid double newlines
         yaml_str = yaml_str.rstrip("\n")
 
-        new_content: str = f"---\n{yaml_str}\n---{remaining}"
+        new_content = f"---\n{yaml_str}\n---{remaining}"
 
         # Write back to file
         file_path.write_text(new_content, encoding="utf-8")
@@ -215,7 +498,7 @@ def update_frontmatter(file_path: Path, updates: dict) -> bool:
         return False
 
 
-def validate_field_value(field_name: str, value: any, note_type: str) -> Optional[str]:
+def validate_field_value(field_name: str, value: Any, note_type: str) -> Optional[str]:
     """
     Validate a field value against its schema.
 
@@ -231,42 +514,40 @@ def validate_field_value(field_name: str, value: any, note_type: str) -> Optiona
         >>> validate_field_value("morning_mood", 15, "daily")
         "morning_mood must be between 1 and 10"
     """
-    fields = DAILY_FIELDS if note_type == "daily" else WEEKLY_FIELDS
+    validators: dict[str, Validator] = (
+        _DAILY_VALIDATORS if note_type == "daily" else _WEEKLY_VALIDATORS
+    )
+    return validators.get(field_name, _allow_any)(value)
 
-    if field_name not in fields:
-        return None  # Unknown fields are allowed
 
-    field_config = fields[field_name]
-    field_type = field_config["type"]
-
-    if field_type == "int":
-        if value == "" or value is None:
-            return None  # Empty values are allowed
-        try:
-            int_value = int(value)
-            min_val, max_val = field_config["range"]
-            if not (min_val <= int_value <= max_val):
-                return f"{field_name} must be between {min_val} and {max_val}"
-        except (ValueError, TypeError):
-            return f"{field_name} must be a number"
-    elif field_type == "float":
-        if value == "" or value is None:
-            return None  # Empty values are allowed
-        try:
-            float_value = float(value)
-            min_val, max_val = field_config["range"]
-            if not (min_val <= float_value <= max_val):
-                return f"{field_name} must be between {min_val} and {max_val}"
-        except (ValueError, TypeError):
-            return f"{field_name} must be a number"
-    elif field_type == "bool":
-        if not isinstance(value, bool):
-            return f"{field_name} must be true or false"
+def validate_updates(updates: dict, note_type: str) -> dict[str, str]:
+    """
+    Validate a batch of field updates in one pass.
 
-    return None
+    Args:
+        updates: Dictionary of field updates
+        note_type: "daily" or "weekly"
 
+    Returns:
+        Dictionary mapping each invalid field to its error message; empty if
+        all values are valid
 
-def get_fields_by_section(note_type: str) -> dict[str, list[str]]:
+    Example:
+        >>> validate_updates({"morning_mood": 15, "fajr": True}, "daily")
+        {"morning_mood": "morning_mood must be between 0 and 10"}
+    """
+    validators: dict[str, Validator] = (
+        _DAILY_VALIDATORS if note_type == "daily" else _WEEKLY_VALIDATORS
+    )
+    errors: dict[str, str] = {}
+    for field_name, value in updates.items():
+        error: Optional[str] = validators.get(field_name, _allow_any)(value)
+        if error:
+            errors[field_name] = error
+    return errors
+
+
+def get_fields_by_section(note_type: str) -> Mapping[str, tuple[str, ...]]:
     """
     Get fields organized by section.
 
@@ -274,20 +555,11 @@ def get_fields_by_section(note_type: str) -> dict[str, list[str]]:
         note_type: "daily" or "weekly"
 
     Returns:
-        Dictionary mapping section names to lists of field names
+        Read-only mapping of section names to tuples of field names
 
     Example:
         >>> sections = get_fields_by_section("daily")
         >>> sections["Mood"]
-        ["morning_mood", "evening_mood"]
+        ("morning_mood", "evening_mood")
     """
-    fields = DAILY_FIELDS if note_type == "daily" else WEEKLY_FIELDS
-    sections = {}
-
-    for field_name, field_config in fields.items():
-        section = field_config["section"]
-        if section not in sections:
-            sections[section] = []
-        sections[section].append(field_name)
-
-    return sections
+    return _DAILY_SECTIONS if note_type == "daily" else _WEEKLY_SECTIONS
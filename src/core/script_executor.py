@@ -1,19 +1,329 @@
 """
 Script executor for running JavaScript files with Node.js.
-Creates a wrapper to simulate the Obsidian QuickAdd API.
+Runs scripts in a long-lived Node.js worker that simulates the Obsidian QuickAdd API.
 """
 
 # ----- Built-In Modules-----
 import json
+import os
+import queue
+import re
 import subprocess
-import tempfile
-from dataclasses import dataclass
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 # ----- Core Modules-----
 from src.core.config import Config
 
+# Seconds a single script may run before the worker is killed
+SCRIPT_TIMEOUT = 30
+
+# Prefix of the worker's response lines; anything else on stdout is script output.
+# Responses start with a newline, so the marker begins a line even when a script
+# left its own output unterminated.
+_RESULT_MARKER = "@@OBSIDIAN_FORGE_RESULT@@"
+
+# Node.js worker, run with `node -e`. It reads one JSON request per stdin line,
+# runs the requested script against a simulated Obsidian environment, and
+# writes one marked JSON response line per request.
+_NODE_WORKER_JS = r"""
+const fs = require('fs');
+const path = require('path');
+const readline = require('readline');
+
+const RESULT_MARKER = '@@OBSIDIAN_FORGE_RESULT@@';
+
+// Simulate Obsidian app.vault API
+function createApp(vaultPath) {
+    return {
+        vault: {
+            adapter: {
+                read: function(filePath) {
+                    const fullPath = path.join(vaultPath, filePath);
+                    return fs.promises.readFile(fullPath, 'utf-8');
+                }
+            },
+            getAbstractFileByPath: function(filePath) {
+                const fullPath = path.join(vaultPath, filePath);
+                if (fs.existsSync(fullPath)) {
+                    return {
+                        path: filePath,
+                        fullPath: fullPath
+                    };
+                }
+                return null;
+            },
+            read: function(file) {
+                return fs.promises.readFile(file.fullPath, 'utf-8');
+            },
+            modify: function(file, content) {
+                return fs.promises.writeFile(file.fullPath, content, 'utf-8');
+            }
+        }
+    };
+}
+
+// Simulate QuickAdd API
+function createInputApi(userInput) {
+    return {
+        wideInputPrompt: function(title, placeholder) {
+            // Return the user input provided
+            return Promise.resolve(userInput);
+        }
+    };
+}
+
+// Simulate QuickAdd API with pre-collected responses for the sleep script
+function createSleepApi(inputs) {
+    // Track which prompts have been called to return appropriate values
+    let suggesterCallCount = 0;
+    let wideInputCallCount = 0;
+
+    return {
+        wideInputPrompt: function(title, placeholder) {
+            wideInputCallCount++;
+            // First call: sleep/wake times, Second call: dream descriptions
+            if (wideInputCallCount === 1) {
+                return Promise.resolve(inputs.sleep_wake_times);
+            } else {
+                return Promise.resolve(inputs.dream_descriptions);
+            }
+        },
+
+        suggester: function(displayItems, actualValues) {
+            suggesterCallCount++;
+            // First suggester call: time entry selection (we use custom since we have the time)
+            // Second suggester call: sleep quality
+            if (suggesterCallCount === 1) {
+                // Return "CUSTOM" to trigger custom time entry path
+                // since we already have the time in sleep_wake_times
+                return Promise.resolve('CUSTOM');
+            } else {
+                // Sleep quality selection
+                return Promise.resolve(inputs.quality);
+            }
+        },
+
+        yesNoPrompt: function(question) {
+            // Did you have any dreams?
+            return Promise.resolve(inputs.had_dreams);
+        }
+    };
+}
+
+// Modification times of the cached script modules, by file path
+const moduleMtimes = new Map();
+
+function mtimeOf(file) {
+    try {
+        return fs.statSync(file).mtimeMs;
+    } catch (error) {
+        return -1;
+    }
+}
+
+// require.cache only holds modules loaded by scripts. If any of them changed
+// on disk, drop them all: modules requiring a changed file hold its old exports
+function refreshModules() {
+    const files = Object.keys(require.cache);
+    if (files.some((file) => moduleMtimes.get(file) !== mtimeOf(file))) {
+        for (const file of files) {
+            delete require.cache[file];
+        }
+        moduleMtimes.clear();
+    }
+}
+
+function recordModules() {
+    for (const file of Object.keys(require.cache)) {
+        if (!moduleMtimes.has(file)) {
+            moduleMtimes.set(file, mtimeOf(file));
+        }
+    }
+}
+
+// Thrown in place of process.exit() so a script can't stop the shared worker
+class ScriptExit extends Error {
+    constructor(code) {
+        super('Script exited with code ' + code);
+        this.code = code;
+    }
+}
+
+async function runRequest(request) {
+    const notices = [];
+
+    // Simulate Notice API
+    class Notice {
+        constructor(message, duration) {
+            notices.push(String(message));
+            this.message = message;
+        }
+    }
+
+    // Make these global
+    global.app = createApp(request.vaultPath);
+    global.Notice = Notice;
+
+    const quickAddApi = request.sleepInputs
+        ? createSleepApi(request.sleepInputs)
+        : createInputApi(request.userInput);
+
+    const exit = process.exit;
+    process.exit = (code) => {
+        throw new ScriptExit(code === undefined ? process.exitCode || 0 : code);
+    };
+
+    try {
+        refreshModules();
+        let scriptModule;
+        try {
+            scriptModule = require(request.scriptPath);
+        } finally {
+            recordModules();
+        }
+        await scriptModule({ quickAddApi });
+        return { success: true, notices: notices };
+    } catch (error) {
+        if (error instanceof ScriptExit && !Number(error.code)) {
+            // process.exit(0) ends the script successfully, like it used to
+            return { success: true, notices: notices };
+        }
+        let message = 'SCRIPT_ERROR: ' + (error && error.message !== undefined ? error.message : error);
+        if (request.sleepInputs && error && error.stack) {
+            message += '\n' + error.stack;
+        }
+        return { success: false, notices: notices, error: message };
+    } finally {
+        process.exit = exit;
+    }
+}
+
+// Keep the worker alive when a script leaves a rejected promise behind
+process.on('unhandledRejection', (reason) => {
+    console.error('Unhandled rejection:', reason);
+});
+
+// Run requests one at a time, in the order they arrive
+let pending = Promise.resolve();
+const input = readline.createInterface({ input: process.stdin });
+input.on('line', (line) => {
+    pending = pending.then(async () => {
+        const response = await runRequest(JSON.parse(line));
+        process.stdout.write('\n' + RESULT_MARKER + JSON.stringify(response) + '\n');
+    });
+});
+input.on('close', () => {
+    pending.then(() => process.exit(0));
+});
+"""
+
+# Icons for known scripts, keyed by lowercased display name (SVG file names)
+_ICON_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "win": "daily-weekly/win.svg",
+        "gratitude": "daily-weekly/gratitude.svg",
+        "dream": "daily-weekly/dream.svg",
+        "sleep": "daily-weekly/sleep.svg",
+        "review": "daily-weekly/review.svg",
+        "journal entries": "daily-weekly/journal_entries.svg",
+        "progress": "daily-weekly/progress.svg",
+        "open loops": "daily-weekly/open_loops.svg",
+        "discovery": "daily-weekly/discovery.svg",
+        "miss": "daily-weekly/miss.svg",
+    }
+)
+
+
+# Bytes read from the top of a script when looking for header directives
+_HEADER_BYTES = 512
+
+# "// @name: Dream" style directives in a script's header comment
+_HEADER_DIRECTIVE = re.compile(r"^//\s*@(\w+):\s*(.+?)\s*$", re.MULTILINE)
+
+
+def _read_script_header(path: str) -> Dict[str, str]:
+    """
+    Parse "// @key: value" directives from the start of a script.
+
+    Args:
+        path: Path to the JavaScript file
+
+    Returns:
+        Dictionary of directive names to values, e.g. {"name": "Dream"}
+    """
+    fd: int = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        head: bytes = os.read(fd, _HEADER_BYTES)
+    finally:
+        os.close(fd)
+
+    text: str = head.decode("utf-8", errors="ignore")
+    if len(head) == _HEADER_BYTES:
+        # Drop the last line, it may have been cut off
+        text = text[: text.rfind("\n") + 1]
+    return dict(_HEADER_DIRECTIVE.findall(text))
+
+
+@lru_cache(maxsize=256)
+def _script_metadata(path: str, prefix: str, mtime_ns: int) -> tuple[str, str]:
+    """
+    Display name and icon of a script, memoized on its modification time.
+
+    "// @name:" and "// @icon:" header directives take precedence; otherwise
+    the name is derived from the file name (minus prefix, e.g. "add-daily-")
+    and the icon is looked up in _ICON_MAP.
+
+    Args:
+        path: Path to the JavaScript file
+        prefix: File name prefix to strip from the derived name
+        mtime_ns: Only part of the cache key, so edited scripts are re-read
+
+    Returns:
+        Tuple of (name, icon)
+    """
+    try:
+        header: Dict[str, str] = _read_script_header(path)
+    except OSError:
+        header = {}
+
+    # Parse script name and icon from filename
+    name: str = header.get("name") or (
+        os.path.basename(path)[:-3].removeprefix(prefix).replace("-", " ").title()
+    )
+    icon: str = header.get("icon") or _ICON_MAP.get(name.lower(), "file.svg")
+    return name, icon
+
+
+def _build_result(response: Dict[str, Any], success_message: str) -> Dict[str, Any]:
+    """
+    Turn a worker response into an execute_* result dictionary.
+
+    Args:
+        response: Worker response with 'success', 'notices' and optional 'error'
+        success_message: Output to report when the script shows no notices
+
+    Returns:
+        Dictionary with 'success' (bool), 'output' (str), and 'error' (str or None)
+    """
+    notices: list[str] = response["notices"]
+    if response["success"]:
+        return {
+            "success": True,
+            "output": "\n".join(notices) if notices else success_message,
+            "error": None,
+        }
+    return {
+        "success": False,
+        "output": "\n".join(notices),
+        "error": response.get("error") or "Unknown error",
+    }
+
 
 @dataclass
 class SleepScriptInputs:
@@ -25,314 +335,218 @@ class SleepScriptInputs:
     dream_descriptions: str  # Multi-line dream descriptions (empty if no dreams)
 
 
-class ScriptExecutor:
-    """Executes JavaScript scripts using Node.js with a simulated QuickAdd API."""
+class NodeWorker:
+    """A long-lived Node.js process that runs scripts sent to it over stdin."""
+
+    def __init__(self, nodejs_path: str, vault_path: str) -> None:
+        self.nodejs_path: str = nodejs_path
+        self.vault_path: str = vault_path
+        self._process = subprocess.Popen(
+            [nodejs_path, "-e", _NODE_WORKER_JS],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding="utf-8",
+            errors="replace",
+            cwd=vault_path,  # Run in vault directory for relative paths
+        )
+        self._responses: queue.Queue = queue.Queue()
+        self._stderr: deque[str] = deque(maxlen=50)
+
+        # Drain both pipes in the background so the worker never blocks on them
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+        threading.Thread(target=self._read_stderr, daemon=True).start()
+
+    def _read_stdout(self) -> None:
+        """Queue every response line; None marks that the worker exited."""
+        for line in self._process.stdout:
+            if line.startswith(_RESULT_MARKER):
+                self._responses.put(json.loads(line[len(_RESULT_MARKER) :]))
+        self._responses.put(None)
+
+    def _read_stderr(self) -> None:
+        """Keep the tail of stderr for reporting crashes."""
+        for line in self._process.stderr:
+            self._stderr.append(line)
+
+    def is_alive(self) -> bool:
+        """Check whether the worker process is still running."""
+        return self._process.poll() is None
+
+    def send(self, request: Dict[str, Any]) -> None:
+        """
+        Queue a request in the worker without waiting for its response.
 
-    def __init__(self, config: Config) -> None:
-        self.config: Config = config
+        Requests run one at a time in the order they were sent.
 
-    def create_wrapper_script(self, script_path: Path, user_input: str) -> str:
+        Args:
+            request: JSON-serializable request for the worker
         """
-        Create a Node.js wrapper script that simulates the Obsidian environment.
+        try:
+            self._process.stdin.write(json.dumps(request) + "\n")
+            self._process.stdin.flush()
+        except OSError:
+            # Broken pipe: the worker already exited, receive() reports it
+            pass
+
+    def receive(self, timeout: float) -> Dict[str, Any]:
+        """
+        Wait for the response to the oldest unanswered request.
 
         Args:
-            script_path: Path to the JavaScript script to execute
-            user_input: User input to pass to the script
+            timeout: Seconds to wait for the response
 
         Returns:
-            JavaScript code as a string
-        """
-        vault_path_escaped: str = str(self.config.vault_path).replace("\\", "\\\\")
-        script_path_escaped: str = str(script_path).replace("\\", "\\\\")
-        user_input_escaped: str = (
-            user_input.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n")
-        )
+            The worker's response with 'success', 'notices' and optional 'error'
 
-        wrapper: str = f"""
-const fs = require('fs');
-const path = require('path');
+        Raises:
+            subprocess.TimeoutExpired: If no response arrives in time; the
+                worker is killed
+            RuntimeError: If the worker exits before responding
+        """
+        try:
+            response = self._responses.get(timeout=timeout)
+        except queue.Empty:
+            self.close()
+            raise subprocess.TimeoutExpired(self.nodejs_path, timeout)
+
+        if response is None:
+            self._process.wait()
+            details: str = "".join(self._stderr).strip()
+            raise RuntimeError(details or "Node.js worker exited unexpectedly")
+        return response
+
+    def close(self) -> None:
+        """Stop the worker, killing it if it doesn't exit on its own."""
+        if not self.is_alive():
+            return
+        try:
+            # Closing stdin lets the worker finish and exit cleanly
+            self._process.stdin.close()
+            self._process.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            self._process.kill()
+            self._process.wait()
 
-// Simulate Obsidian app.vault API
-const app = {{
-    vault: {{
-        adapter: {{
-            read: function(filePath) {{
-                const fullPath = path.join('{vault_path_escaped}', filePath);
-                return fs.promises.readFile(fullPath, 'utf-8');
-            }}
-        }},
-        getAbstractFileByPath: function(filePath) {{
-            const fullPath = path.join('{vault_path_escaped}', filePath);
-            if (fs.existsSync(fullPath)) {{
-                return {{
-                    path: filePath,
-                    fullPath: fullPath
-                }};
-            }}
-            return null;
-        }},
-        read: function(file) {{
-            return fs.promises.readFile(file.fullPath, 'utf-8');
-        }},
-        modify: function(file, content) {{
-            return fs.promises.writeFile(file.fullPath, content, 'utf-8');
-        }}
-    }}
-}};
-
-// Simulate Notice API
-class Notice {{
-    constructor(message, duration) {{
-        console.log('NOTICE:', message);
-        this.message = message;
-    }}
-}}
-
-// Make these global
-global.app = app;
-global.Notice = Notice;
 
-// Simulate QuickAdd API
-const quickAddApi = {{
-    wideInputPrompt: function(title, placeholder) {{
-        // Return the user input provided
-        return Promise.resolve('{user_input_escaped}');
-    }}
-}};
-
-// Load and execute the script
-const scriptModule = require('{script_path_escaped}');
-
-// Execute the script
-scriptModule({{ quickAddApi }})
-    .then(() => {{
-        console.log('SCRIPT_COMPLETE');
-        process.exit(0);
-    }})
-    .catch((error) => {{
-        console.error('SCRIPT_ERROR:', error.message);
-        process.exit(1);
-    }});
-"""
-        return wrapper
+class ScriptExecutor:
+    """Executes JavaScript scripts using Node.js with a simulated QuickAdd API."""
 
-    def execute_script(self, script_path: Path, user_input: str) -> Dict[str, Any]:
+    def __init__(self, config: Config) -> None:
+        self.config: Config = config
+        self._worker: Optional[NodeWorker] = None
+        self._worker_lock = threading.Lock()
+
+    def _get_worker(self) -> NodeWorker:
+        """Return a running worker for the current Node.js and vault paths."""
+        nodejs_path: str = self.config.nodejs_path
+        vault_path: str = str(self.config.vault_path)
+
+        worker: Optional[NodeWorker] = self._worker
+        if (
+            worker is None
+            or not worker.is_alive()
+            or worker.nodejs_path != nodejs_path
+            or worker.vault_path != vault_path
+        ):
+            if worker is not None:
+                worker.close()
+            worker = self._worker = NodeWorker(nodejs_path, vault_path)
+        return worker
+
+    def _run_batch(
+        self, requests: list[Dict[str, Any]], success_message: str
+    ) -> list[Dict[str, Any]]:
         """
-        Execute a JavaScript script with the given user input.
+        Run script requests back-to-back in the worker.
+
+        All requests are sent before the first response is awaited, and each
+        script gets its own timeout. If one times out or the worker crashes,
+        the remaining requests are not run and report the same error.
 
         Args:
-            script_path: Path to the JavaScript script
-            user_input: User input to pass to the script
+            requests: Worker requests; 'vaultPath' is filled in here
+            success_message: Output to report when a script shows no notices
 
         Returns:
-            Dictionary with 'success' (bool), 'output' (str), and 'error' (str or None)
+            One dictionary per request with 'success' (bool), 'output' (str),
+            and 'error' (str or None)
         """
-        try:
-            # Create wrapper script
-            wrapper_code: str = self.create_wrapper_script(script_path, user_input)
-
-            # Write wrapper to temp file
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".js", delete=False, encoding="utf-8"
-            ) as f:
-                temp_script: str = f.name
-                f.write(wrapper_code)
-
-            # Execute with Node.js
-            result = subprocess.run(
-                [self.config.nodejs_path, temp_script],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                cwd=str(
-                    self.config.vault_path
-                ),  # Run in vault directory for relative paths
-            )
-
-            # Clean up temp file
+        if not requests:
+            return []
+
+        results: list[Dict[str, Any]] = []
+        with self._worker_lock:
             try:
-                Path(temp_script).unlink()
-            except:
-                pass
-
-            # Parse output
-            output_lines: list[str] = result.stdout.strip().split("\n")
-            notices: list[str] = [
-                line.replace("NOTICE:", "").strip()
-                for line in output_lines
-                if line.startswith("NOTICE:")
-            ]
-
-            if result.returncode == 0:
-                return {
-                    "success": True,
-                    "output": (
-                        "\n".join(notices)
-                        if notices
-                        else "Script executed successfully"
-                    ),
-                    "error": None,
-                }
+                worker: NodeWorker = self._get_worker()
+                for request in requests:
+                    request["vaultPath"] = worker.vault_path
+                    worker.send(request)
+                for _ in requests:
+                    response: Dict[str, Any] = worker.receive(SCRIPT_TIMEOUT)
+                    results.append(_build_result(response, success_message))
+            except subprocess.TimeoutExpired:
+                error: str = f"Script execution timed out ({SCRIPT_TIMEOUT} seconds)"
+            except Exception as e:
+                error = str(e)
             else:
-                error_msg: str = result.stderr or "Unknown error"
-                return {
-                    "success": False,
-                    "output": "\n".join(notices) if notices else "",
-                    "error": error_msg,
-                }
+                return results
 
-        except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "output": "",
-                "error": "Script execution timed out (30 seconds)",
-            }
-        except Exception as e:
-            return {"success": False, "output": "", "error": str(e)}
+        # Fill in the failed request and everything queued after it
+        for _ in range(len(requests) - len(results)):
+            results.append({"success": False, "output": "", "error": error})
+        return results
 
-    def create_sleep_wrapper_script(
-        self, script_path: Path, inputs: SleepScriptInputs
-    ) -> str:
+    def _run(self, request: Dict[str, Any], success_message: str) -> Dict[str, Any]:
         """
-        Create a Node.js wrapper script specifically for the sleep script.
-
-        This wrapper pre-populates all the QuickAdd API responses with the
-        collected input data, so the script can run non-interactively.
+        Run a single script request in the worker.
 
         Args:
-            script_path: Path to the add-daily-sleep.js script
-            inputs: Pre-collected sleep input data
+            request: Worker request; 'vaultPath' is filled in here
+            success_message: Output to report when the script shows no notices
 
         Returns:
-            JavaScript code as a string
+            Dictionary with 'success' (bool), 'output' (str), and 'error' (str or None)
         """
-        vault_path_escaped: str = str(self.config.vault_path).replace("\\", "\\\\")
-        script_path_escaped: str = str(script_path).replace("\\", "\\\\")
-
-        # Escape the sleep/wake times string
-        sleep_wake_escaped: str = (
-            inputs.sleep_wake_times.replace("\\", "\\\\")
-            .replace("'", "\\'")
-            .replace("\n", "\\n")
-        )
-
-        # Quality value (null if skipped)
-        quality_js: str = f"'{inputs.quality}'" if inputs.quality else "null"
+        return self._run_batch([request], success_message)[0]
 
-        # Dreams value
-        had_dreams_js = "true" if inputs.had_dreams else "false"
+    def execute_script(self, script_path: Path, user_input: str) -> Dict[str, Any]:
+        """
+        Execute a JavaScript script with the given user input.
 
-        # Dream descriptions (escaped)
-        dream_desc_escaped: str = (
-            inputs.dream_descriptions.replace("\\", "\\\\")
-            .replace("'", "\\'")
-            .replace("\n", "\\n")
-        )
+        Args:
+            script_path: Path to the JavaScript script
+            user_input: User input to pass to the script
 
-        wrapper = f"""
-const fs = require('fs');
-const path = require('path');
+        Returns:
+            Dictionary with 'success' (bool), 'output' (str), and 'error' (str or None)
+        """
+        request: Dict[str, Any] = {
+            "scriptPath": str(script_path),
+            "userInput": user_input,
+        }
+        return self._run(request, "Script executed successfully")
+
+    def execute_scripts_batch(
+        self, requests: list[tuple[Path, str]]
+    ) -> list[Dict[str, Any]]:
+        """
+        Execute several scripts in one go, in order.
 
-// Pre-collected inputs from Python UI
-const PRECOLLECTED_INPUTS = {{
-    sleepWakeTimes: '{sleep_wake_escaped}',
-    quality: {quality_js},
-    hadDreams: {had_dreams_js},
-    dreamDescriptions: '{dream_desc_escaped}'
-}};
+        The scripts are pipelined into the Node.js worker rather than run in
+        parallel: they usually edit the same note, so they must not overlap.
 
-// Track which prompts have been called to return appropriate values
-let suggesterCallCount = 0;
-let wideInputCallCount = 0;
+        Args:
+            requests: (script_path, user_input) pairs
 
-// Simulate Obsidian app.vault API
-const app = {{
-    vault: {{
-        adapter: {{
-            read: function(filePath) {{
-                const fullPath = path.join('{vault_path_escaped}', filePath);
-                return fs.promises.readFile(fullPath, 'utf-8');
-            }}
-        }},
-        getAbstractFileByPath: function(filePath) {{
-            const fullPath = path.join('{vault_path_escaped}', filePath);
-            if (fs.existsSync(fullPath)) {{
-                return {{
-                    path: filePath,
-                    fullPath: fullPath
-                }};
-            }}
-            return null;
-        }},
-        read: function(file) {{
-            return fs.promises.readFile(file.fullPath, 'utf-8');
-        }},
-        modify: function(file, content) {{
-            return fs.promises.writeFile(file.fullPath, content, 'utf-8');
-        }}
-    }}
-}};
-
-// Simulate Notice API
-class Notice {{
-    constructor(message, duration) {{
-        console.log('NOTICE:', message);
-        this.message = message;
-    }}
-}}
-
-// Make these global
-global.app = app;
-global.Notice = Notice;
-
-// Simulate QuickAdd API with pre-collected responses
-const quickAddApi = {{
-    wideInputPrompt: function(title, placeholder) {{
-        wideInputCallCount++;
-        // First call: sleep/wake times, Second call: dream descriptions
-        if (wideInputCallCount === 1) {{
-            return Promise.resolve(PRECOLLECTED_INPUTS.sleepWakeTimes);
-        }} else {{
-            return Promise.resolve(PRECOLLECTED_INPUTS.dreamDescriptions);
-        }}
-    }},
-
-    suggester: function(displayItems, actualValues) {{
-        suggesterCallCount++;
-        // First suggester call: time entry selection (we use custom since we have the time)
-        // Second suggester call: sleep quality
-        if (suggesterCallCount === 1) {{
-            // Return "CUSTOM" to trigger custom time entry path
-            // since we already have the time in sleepWakeTimes
-            return Promise.resolve('CUSTOM');
-        }} else {{
-            // Sleep quality selection
-            return Promise.resolve(PRECOLLECTED_INPUTS.quality);
-        }}
-    }},
-
-    yesNoPrompt: function(question) {{
-        // Did you have any dreams?
-        return Promise.resolve(PRECOLLECTED_INPUTS.hadDreams);
-    }}
-}};
-
-// Load and execute the script
-const scriptModule = require('{script_path_escaped}');
-
-// Execute the script
-scriptModule({{ quickAddApi }})
-    .then(() => {{
-        console.log('SCRIPT_COMPLETE');
-        process.exit(0);
-    }})
-    .catch((error) => {{
-        console.error('SCRIPT_ERROR:', error.message);
-        console.error(error.stack);
-        process.exit(1);
-    }});
-"""
-        return wrapper
+        Returns:
+            One result dictionary per request, as returned by execute_script
+        """
+        worker_requests: list[Dict[str, Any]] = [
+            {"scriptPath": str(script_path), "userInput": user_input}
+            for script_path, user_input in requests
+        ]
+        return self._run_batch(worker_requests, "Script executed successfully")
 
     def execute_sleep_script(
         self, script_path: Path, inputs: SleepScriptInputs
@@ -340,6 +554,9 @@ scriptModule({{ quickAddApi }})
         """
         Execute the sleep script with pre-collected inputs.
 
+        The worker pre-populates all the QuickAdd API responses with the
+        collected input data, so the script can run non-interactively.
+
         Args:
             script_path: Path to the add-daily-sleep.js script
             inputs: Pre-collected sleep input data
@@ -347,66 +564,18 @@ scriptModule({{ quickAddApi }})
         Returns:
             Dictionary with 'success' (bool), 'output' (str), and 'error' (str or None)
         """
-        try:
-            # Create wrapper script
-            wrapper_code: str = self.create_sleep_wrapper_script(script_path, inputs)
-
-            # Write wrapper to temp file
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".js", delete=False, encoding="utf-8"
-            ) as f:
-                temp_script: str = f.name
-                f.write(wrapper_code)
-
-            # Execute with Node.js
-            result = subprocess.run(
-                [self.config.nodejs_path, temp_script],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                cwd=str(self.config.vault_path),
-            )
-
-            # Clean up temp file
-            try:
-                Path(temp_script).unlink()
-            except:
-                pass
-
-            # Parse output
-            output_lines: list[str] = result.stdout.strip().split("\n")
-            notices: list[str] = [
-                line.replace("NOTICE:", "").strip()
-                for line in output_lines
-                if line.startswith("NOTICE:")
-            ]
-
-            if result.returncode == 0:
-                return {
-                    "success": True,
-                    "output": (
-                        "\n".join(notices)
-                        if notices
-                        else "Sleep entry added successfully"
-                    ),
-                    "error": None,
-                }
-            else:
-                error_msg: str = result.stderr or "Unknown error"
-                return {
-                    "success": False,
-                    "output": "\n".join(notices) if notices else "",
-                    "error": error_msg,
-                }
-
-        except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "output": "",
-                "error": "Script execution timed out (30 seconds)",
-            }
-        except Exception as e:
-            return {"success": False, "output": "", "error": str(e)}
+        request: Dict[str, Any] = {
+            "scriptPath": str(script_path),
+            "sleepInputs": asdict(inputs),
+        }
+        return self._run(request, "Sleep entry added successfully")
+
+    def close(self) -> None:
+        """Stop the Node.js worker, if one is running."""
+        with self._worker_lock:
+            if self._worker is not None:
+                self._worker.close()
+                self._worker = None
 
     def get_available_scripts(self, script_type: str) -> list[Dict[str, str]]:
         """
@@ -424,39 +593,28 @@ scriptModule({{ quickAddApi }})
             scripts_dir = self.config.get_weekly_scripts_path()
         else:
             return []
+        prefix: str = f"add-{script_type}-"
 
-        if not scripts_dir or not scripts_dir.exists():
+        if not scripts_dir:
             return []
 
-        scripts = []
-        for script_file in sorted(scripts_dir.glob("*.js")):
-            if script_file.stem.endswith(".bak"):
-                continue
-
-            # Parse script name and icon from filename
-            name: str = (
-                script_file.stem.replace("add-daily-", "")
-                .replace("add-weekly-", "")
-                .replace("-", " ")
-                .title()
-            )
-
-            # Assign icons based on script name (SVG file names)
-            icon_map: Dict[str, str] = {
-                "win": "daily-weekly/win.svg",
-                "gratitude": "daily-weekly/gratitude.svg",
-                "dream": "daily-weekly/dream.svg",
-                "sleep": "daily-weekly/sleep.svg",
-                "review": "daily-weekly/review.svg",
-                "journal entries": "daily-weekly/journal_entries.svg",
-                "progress": "daily-weekly/progress.svg",
-                "open loops": "daily-weekly/open_loops.svg",
-                "discovery": "daily-weekly/discovery.svg",
-                "miss": "daily-weekly/miss.svg",
-            }
-
-            icon: str = icon_map.get(name.lower(), "file.svg")
-
-            scripts.append({"name": name, "path": str(script_file), "icon": icon})
+        scripts: list[Dict[str, str]] = []
+        try:
+            with os.scandir(scripts_dir) as entries:
+                for entry in entries:
+                    file_name: str = entry.name
+                    if not file_name.endswith(".js") or file_name.endswith(".bak.js"):
+                        continue
+
+                    try:
+                        mtime_ns: int = entry.stat().st_mtime_ns
+                    except OSError:
+                        continue
+
+                    name, icon = _script_metadata(entry.path, prefix, mtime_ns)
+                    scripts.append({"name": name, "path": entry.path, "icon": icon})
+        except OSError:
+            return []
 
+        scripts.sort(key=lambda script: script["path"])
         return scripts
@@ -1,28 +1,57 @@
-"""UI modules for Obsidian Forge application."""
-
-from src.ui import components
-from src.ui.about_dialog import AboutDialog
-from src.ui.frontmatter import DailyFrontmatterDialog, WeeklyFrontmatterDialog
-from src.ui.file_dialog_window import FileDialog
-from src.ui.main_window import MainWindow
-from src.ui.popup_window import PopupIcon, PopupWindow
-from src.ui.settings_dialog import SettingsDialog
-from src.ui.sleep_dialog import SleepInputDialog
-from src.ui.styles.build_styles import build_stylesheet
-from src.ui.widgets import ScriptRow, SettingsGroup
-
-__all__: list[str] = [
-    "AboutDialog",
-    "DailyFrontmatterDialog",
-    "FileDialog",
-    "MainWindow",
-    "PopupIcon",
-    "PopupWindow",
-    "ScriptRow",
-    "SettingsDialog",
-    "SettingsGroup",
-    "SleepInputDialog",
-    "WeeklyFrontmatterDialog",
-    "build_stylesheet",
-    "components",
-]
+"""UI modules for Obsidian Forge application.
+
+Exports are imported on first access (PEP 562), so importing one dialog
+doesn't load every other window along with it.
+"""
+
+# ----- Built-In Modules-----
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.ui import components
+    from src.ui.about_dialog import AboutDialog
+    from src.ui.file_dialog_window import FileDialog, FileDialogStyle
+    from src.ui.frontmatter import DailyFrontmatterDialog, WeeklyFrontmatterDialog
+    from src.ui.main_window import MainWindow
+    from src.ui.popup_window import PopupIcon, PopupWindow
+    from src.ui.settings_dialog import SettingsDialog
+    from src.ui.sleep_dialog import SleepInputDialog
+    from src.ui.styles.build_styles import build_stylesheet
+    from src.ui.widgets import ScriptRow, SettingsGroup
+
+# Every lazily imported export and the module defining it
+_EXPORTS: tuple[tuple[str, str], ...] = (
+    ("AboutDialog", "src.ui.about_dialog"),
+    ("DailyFrontmatterDialog", "src.ui.frontmatter"),
+    ("FileDialog", "src.ui.file_dialog_window"),
+    ("FileDialogStyle", "src.ui.file_dialog_window"),
+    ("MainWindow", "src.ui.main_window"),
+    ("PopupIcon", "src.ui.popup_window"),
+    ("PopupWindow", "src.ui.popup_window"),
+    ("ScriptRow", "src.ui.widgets"),
+    ("SettingsDialog", "src.ui.settings_dialog"),
+    ("SettingsGroup", "src.ui.widgets"),
+    ("SleepInputDialog", "src.ui.sleep_dialog"),
+    ("WeeklyFrontmatterDialog", "src.ui.frontmatter"),
+    ("build_stylesheet", "src.ui.styles.build_styles"),
+)
+_LAZY_IMPORTS: dict[str, str] = dict(_EXPORTS)
+
+__all__: list[str] = [name for name, _ in _EXPORTS] + ["components"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an export on first access and cache it in the module globals."""
+    module_name: str | None = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        # Submodules such as components are found by the import system
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value: Any = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
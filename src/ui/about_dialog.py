@@ -3,13 +3,16 @@ About dialog for Obsidian Forge.
 A visually appealing dialog with Tokyo Night theme styling.
 """
 
+# ----- Built-In Modules-----
+from functools import lru_cache
+
 # ----- PySide6 Modules-----
-from PySide6.QtCore import QSize, Qt
-from PySide6.QtGui import QColor, QLinearGradient, QPainter, QPen
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor, QLinearGradient, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import (
     QDialog,
     QFrame,
-    QGraphicsDropShadowEffect,
+    QGridLayout,
     QHBoxLayout,
     QLabel,
     QVBoxLayout,
@@ -27,55 +30,73 @@ from src.utils import (
     COLOR_RED,
     THEME_TEXT_PRIMARY,
     HoverIconButtonSVG,
-    get_icon,
+    get_icon_pixmap,
 )
 
+# Fixed dialog size, also used to center it without querying geometry()
+_DIALOG_WIDTH = 350
+_DIALOG_HEIGHT = 450
 
-class GlowingLine(QFrame):
-    """A horizontal line with a glowing gradient effect."""
+# Feature rows shown in the dialog: (icon, text)
+_FEATURES: tuple[tuple[str, str], ...] = (
+    ("daily-weekly/daily.svg", "Daily note quick entries"),
+    ("daily-weekly/weekly.svg", "Weekly note quick entries"),
+    ("application/nodejs.svg", "Native QuickAdd script support"),
+)
 
-    def __init__(self, parent=None) -> None:
-        super().__init__(parent)
-        self.setFixedHeight(2)
-        self.setStyleSheet("background: transparent;")
+_AUTHOR_HTML: str = (
+    f'Created with <span style="color: {COLOR_RED}; font-size: 12px;">\u2665</span>'
+    f" by {AUTHOR}"
+)
+_WEBSITE_HTML: str = (
+    f'<a href="{WEBSITE_URL}" style="color: {COLOR_LIGHT_BLUE};">{WEBSITE_URL}</a>'
+)
 
-    def paintEvent(self, event) -> None:
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+# GlowingLine gradient stops, parsed once instead of on every render
+_GLOW_STOPS: tuple[tuple[float, QColor], ...] = (
+    (0.0, QColor(COLOR_PURPLE)),
+    (0.5, QColor(COLOR_LIGHT_BLUE)),
+    (1.0, QColor(COLOR_CYAN)),
+)
 
-        gradient = QLinearGradient(0, 0, self.width(), 0)
-        gradient.setColorAt(0.0, QColor(COLOR_PURPLE))
-        gradient.setColorAt(0.5, QColor(COLOR_LIGHT_BLUE))
-        gradient.setColorAt(1.0, QColor(COLOR_CYAN))
 
-        pen = QPen()
-        pen.setBrush(gradient)
-        pen.setWidth(2)
-        painter.setPen(pen)
-        painter.drawLine(0, 1, self.width(), 1)
+@lru_cache(maxsize=4)
+def _glow_pixmap(width: int) -> QPixmap:
+    """Pre-render the GlowingLine gradient for a given width."""
+    pixmap = QPixmap(max(width, 1), 2)
+    pixmap.fill(Qt.GlobalColor.transparent)
 
+    gradient = QLinearGradient(0, 0, width, 0)
+    for position, color in _GLOW_STOPS:
+        gradient.setColorAt(position, color)
 
-class FeatureItem(QWidget):
-    """A single feature item with icon and text."""
+    painter = QPainter(pixmap)
+    pen = QPen()
+    pen.setBrush(gradient)
+    pen.setWidth(2)
+    painter.setPen(pen)
+    painter.drawLine(0, 1, width, 1)
+    painter.end()
 
-    def __init__(self, icon_name: str, text: str, parent=None) -> None:
-        super().__init__(parent)
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 4, 0, 4)
-        layout.setSpacing(8)
+    return pixmap
 
-        layout.addStretch()  # Add stretch before to center content
 
-        icon_label = QLabel()
-        icon_label.setPixmap(get_icon(icon_name).pixmap(QSize(16, 16)))
-        icon_label.setStyleSheet("background: transparent;")
-        layout.addWidget(icon_label)
+class GlowingLine(QFrame):
+    """A horizontal line with a glowing gradient effect."""
 
-        text_label = QLabel(text)
-        text_label.setObjectName("FeatureText")
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.setFixedHeight(2)
+        self._pixmap: QPixmap = _glow_pixmap(self.width())
 
-        layout.addWidget(text_label)
-        layout.addStretch()  # Add stretch after to center content
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        # The gradient only depends on the width, so render it once per size
+        self._pixmap = _glow_pixmap(self.width())
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
 
 
 class AboutDialog(QDialog):
@@ -84,7 +105,7 @@ class AboutDialog(QDialog):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.setWindowTitle(f"About {APP_NAME}")
-        self.setFixedSize(350, 450)
+        self.setFixedSize(_DIALOG_WIDTH, _DIALOG_HEIGHT)
         self.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.FramelessWindowHint)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
@@ -93,21 +114,16 @@ class AboutDialog(QDialog):
 
     def setup_ui(self) -> None:
         """Setup the dialog UI."""
+        dpr: float = self.devicePixelRatioF()
+
         # Main layout
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
 
-        # Container with rounded corners and shadow
+        # Container filling the whole dialog
         container = QFrame()
         container.setObjectName("AboutContainer")
-
-        # Add drop shadow
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(30)
-        shadow.setXOffset(0)
-        shadow.setYOffset(4)
-        shadow.setColor(QColor(0, 0, 0, 100))
-        container.setGraphicsEffect(shadow)
+        container.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
 
         container_layout = QVBoxLayout(container)
         container_layout.setContentsMargins(12, 12, 12, 12)
@@ -123,9 +139,10 @@ class AboutDialog(QDialog):
         # App icon
         icon_label = QLabel()
         icon_label.setPixmap(
-            get_icon("application/obsidian_forge.svg").pixmap(QSize(72, 72))
+            get_icon_pixmap(
+                "application/obsidian_forge.svg", 72, device_pixel_ratio=dpr
+            )
         )
-        icon_label.setStyleSheet("background: transparent;")
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         header_layout.addWidget(icon_label)
 
@@ -150,6 +167,12 @@ class AboutDialog(QDialog):
 
         container_layout.addWidget(header_widget)
 
+        # The holders only lay out static labels: they paint no background
+        # of their own and have nothing to click
+        for holder in (header_widget, version_widget):
+            holder.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+            holder.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+
         # Glowing separator
         container_layout.addWidget(GlowingLine())
 
@@ -176,45 +199,37 @@ class AboutDialog(QDialog):
 
         features_layout.addWidget(features_title)
 
-        features: list[tuple[str, str]] = [
-            ("daily-weekly/daily.svg", "Daily note quick entries"),
-            ("daily-weekly/weekly.svg", "Weekly note quick entries"),
-            ("application/nodejs.svg", "Native QuickAdd script support"),
-        ]
-
-        for icon, text in features:
-            features_layout.addWidget(FeatureItem(icon, text))
+        # One grid for all features: icon and text columns between two
+        # stretch columns that keep the block centered
+        features_grid = QGridLayout()
+        features_grid.setContentsMargins(0, 4, 0, 4)
+        features_grid.setHorizontalSpacing(8)
+        features_grid.setVerticalSpacing(10)
+        features_grid.setColumnStretch(0, 1)
+        features_grid.setColumnStretch(3, 1)
 
-        container_layout.addWidget(features_frame)
-
-        # Author section
-        author_widget = QWidget()
-        author_layout = QHBoxLayout(author_widget)
-        author_layout.setContentsMargins(0, 0, 0, 0)
-        author_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        author_layout.setSpacing(6)
+        for row, (icon, text) in enumerate(_FEATURES):
+            icon_label = QLabel()
+            icon_label.setPixmap(get_icon_pixmap(icon, 16, device_pixel_ratio=dpr))
+            features_grid.addWidget(icon_label, row, 1)
 
-        created_label = QLabel("Created with")
-        created_label.setObjectName("Created")
+            text_label = QLabel(text)
+            text_label.setObjectName("FeatureText")
+            features_grid.addWidget(text_label, row, 2)
 
-        author_layout.addWidget(created_label)
+        features_layout.addLayout(features_grid)
 
-        heart_label = QLabel("\u2665")  # Heart symbol
-        heart_label.setObjectName("Heart")
-
-        author_layout.addWidget(heart_label)
-
-        by_label = QLabel(f"by {AUTHOR}")
-        by_label.setObjectName("By")
-
-        author_layout.addWidget(by_label)
+        container_layout.addWidget(features_frame)
 
-        container_layout.addWidget(author_widget)
+        # Author section
+        author_label = QLabel(_AUTHOR_HTML)
+        author_label.setObjectName("Author")
+        author_label.setTextFormat(Qt.TextFormat.RichText)
+        author_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        container_layout.addWidget(author_label)
 
         # Website section
-        website_label = QLabel(
-            f'<a href="{WEBSITE_URL}" style="color: {COLOR_LIGHT_BLUE};">{WEBSITE_URL}</a>'
-        )
+        website_label = QLabel(_WEBSITE_HTML)
         website_label.setObjectName("Website")
         website_label.setOpenExternalLinks(True)
         website_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -249,19 +264,13 @@ class AboutDialog(QDialog):
 
     def center_on_parent(self) -> None:
         """Center the dialog on the parent window."""
-        if self.parent():
-            parent_geometry = self.parent().geometry()
-            dialog_geometry = self.geometry()
-
-            # Calculate center position
-            x = (
-                parent_geometry.x()
-                + (parent_geometry.width() - dialog_geometry.width()) // 2
-            )
-            y = (
-                parent_geometry.y()
-                + (parent_geometry.height() - dialog_geometry.height()) // 2
-            )
+        parent = self.parent()
+        if parent:
+            parent_geometry = parent.geometry()
+
+            # Calculate center position from the fixed dialog size
+            x = parent_geometry.x() + (parent_geometry.width() - _DIALOG_WIDTH) // 2
+            y = parent_geometry.y() + (parent_geometry.height() - _DIALOG_HEIGHT) // 2
 
             self.move(x, y)
 
@@ -3,6 +3,10 @@ Reusable UI component factories for Obsidian Forge.
 Following GitUI's component-based design pattern.
 """
 
+# ----- Built-In Modules -----
+from functools import lru_cache
+from typing import Optional
+
 # ----- PySide6 Modules -----
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
@@ -15,6 +19,27 @@ from src.core import FONT_FAMILY
 from src.utils import COLOR_LIGHT_BLUE, THEME_TEXT_SECONDARY
 
 
+@lru_cache(maxsize=32)
+def _font(size: Optional[int] = None, bold: bool = False) -> QFont:
+    """
+    Get a shared app font, resolving it through Qt's font database only once.
+
+    QFont is implicitly shared, so widgets receiving it via setFont get
+    their own copy; the cached instance itself must not be modified.
+
+    Args:
+        size: Point size (None keeps the default size)
+        bold: Whether the font is bold
+
+    Returns:
+        QFont for FONT_FAMILY with the given size and weight
+    """
+    font = QFont(FONT_FAMILY) if size is None else QFont(FONT_FAMILY, size)
+    if bold:
+        font.setBold(True)
+    return font
+
+
 def create_header_label(text: str, size: int = None) -> QLabel:
     """
     Create a header label with Tokyo Night styling.
@@ -30,10 +55,7 @@ def create_header_label(text: str, size: int = None) -> QLabel:
         size = 13
 
     label = QLabel(text)
-    font = QFont(FONT_FAMILY, size)
-    font.setBold(True)
-    font.setWeight(QFont.Weight.Bold)
-    label.setFont(font)
+    label.setFont(_font(size, bold=True))
     label.setAlignment(Qt.AlignmentFlag.AlignCenter)
     return label
 
@@ -49,8 +71,7 @@ def create_subtitle_label(text: str) -> QLabel:
         Configured QLabel
     """
     label = QLabel(text)
-    font = QFont(FONT_FAMILY, 9)
-    label.setFont(font)
+    label.setFont(_font(9))
     label.setAlignment(Qt.AlignmentFlag.AlignCenter)
     label.setStyleSheet(f"color: {THEME_TEXT_SECONDARY};")
     return label
@@ -67,8 +88,7 @@ def create_info_label(text: str) -> QLabel:
         Configured QLabel with InfoBox property
     """
     label = QLabel(text)
-    font = QFont(FONT_FAMILY)
-    label.setFont(font)
+    label.setFont(_font())
     label.setProperty("InfoBox", True)
     label.setWordWrap(True)
     return label
@@ -95,8 +115,7 @@ def create_icon_label(icon_text: str, text: str = None, size: int = None) -> QLa
         display_text = icon_text
 
     label = QLabel(display_text)
-    font = QFont(FONT_FAMILY, size)
-    label.setFont(font)
+    label.setFont(_font(size))
     return label
 
 
@@ -174,14 +193,13 @@ def create_button_row(*buttons, spacing: int = None) -> QWidget:
         spacing = 8
 
     widget = QWidget()
-    layout = QHBoxLayout()
+    layout = QHBoxLayout(widget)
     layout.setSpacing(spacing)
     layout.addStretch()
 
     for button in buttons:
         layout.addWidget(button)
 
-    widget.setLayout(layout)
     return widget
 
 
@@ -198,34 +216,29 @@ def create_stat_label(icon: str, value: str, label: str = None) -> QWidget:
         QWidget containing the statistic display
     """
     widget = QWidget()
-    layout = QHBoxLayout()
+    layout = QHBoxLayout(widget)
     layout.setContentsMargins(0, 0, 0, 0)
     layout.setSpacing(8)
 
     # Icon
     icon_label = QLabel(icon)
-    icon_font = QFont(FONT_FAMILY, 13)
-    icon_label.setFont(icon_font)
+    icon_label.setFont(_font(13))
     icon_label.setStyleSheet(f"color: {COLOR_LIGHT_BLUE};")
     layout.addWidget(icon_label)
 
     # Value
     value_label = QLabel(value)
-    value_font = QFont(FONT_FAMILY, 11)
-    value_font.setBold(True)
-    value_label.setFont(value_font)
+    value_label.setFont(_font(11, bold=True))
     layout.addWidget(value_label)
 
     # Optional label
     if label:
         label_widget = QLabel(label)
-        label_font = QFont(FONT_FAMILY, 9)
-        label_widget.setFont(label_font)
+        label_widget.setFont(_font(9))
         label_widget.setStyleSheet(f"color: {THEME_TEXT_SECONDARY};")
         layout.addWidget(label_widget)
 
     layout.addStretch()
-    widget.setLayout(layout)
     return widget
 
 
@@ -240,8 +253,6 @@ def create_section_header(text: str) -> QLabel:
         Configured QLabel
     """
     label = QLabel(text)
-    font = QFont(FONT_FAMILY, 11)
-    font.setBold(True)
-    label.setFont(font)
+    label.setFont(_font(11, bold=True))
     label.setStyleSheet(f"color: {COLOR_LIGHT_BLUE};")
     return label
@@ -7,7 +7,7 @@ Provides a dedicated interface for managing directories to exclude from scans.
 from pathlib import Path
 
 # ----- PySide6 Modules -----
-from PySide6.QtCore import QSize, Qt, QTimer
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QCursor, QFont, QKeySequence
 from PySide6.QtWidgets import (
     QDialog,
@@ -33,7 +33,7 @@ from src.utils import (
     THEME_TEXT_PRIMARY,
     THEME_TEXT_SECONDARY,
     HoverIconButtonSVG,
-    get_icon,
+    get_icon_pixmap,
 )
 
 
@@ -109,9 +109,7 @@ class ExcludedDirsManager(QDialog):
 
         # Icon
         icon_label = QLabel()
-        icon_label.setPixmap(
-            get_icon("exclude.svg", color=f"{COLOR_ORANGE}").pixmap(QSize(24, 24))
-        )
+        icon_label.setPixmap(get_icon_pixmap("exclude.svg", 24, f"{COLOR_ORANGE}"))
         icon_label.setFixedSize(24, 24)
         layout.addWidget(icon_label)
 
@@ -273,9 +271,9 @@ class ExcludedDirsManager(QDialog):
         if folders:
 
             # Get existing items
-            existing_items: list[str] = [
+            existing_items: set[str] = {
                 self.list_widget.item(i).text() for i in range(self.list_widget.count())
-            ]
+            }
 
             # Track results
             added_count = 0
@@ -305,7 +303,7 @@ class ExcludedDirsManager(QDialog):
                 # Add to list widget
                 item = QListWidgetItem(path_str)
                 self.list_widget.addItem(item)
-                existing_items.append(path_str)
+                existing_items.add(path_str)
                 added_count += 1
 
             # Sort items
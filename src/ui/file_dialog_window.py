@@ -3,10 +3,14 @@ Reusable file dialog component for Obsidian Forge.
 """
 
 # ----- PySide6 Modules -----
+from PySide6.QtGui import QFileSystemModel, QIcon
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QFileDialog,
     QListView,
+    QProxyStyle,
+    QStyle,
+    QStyleOption,
     QTreeView,
     QWidget,
 )
@@ -15,6 +19,57 @@ from PySide6.QtWidgets import (
 from src.utils import get_icon
 
 
+class FileDialogStyle(QProxyStyle):
+    """
+    Application style that gives QFileDialog toolbars Tokyo Night SVG icons.
+
+    Install it once with ``app.setStyle(FileDialogStyle())``. Qt asks the style
+    for these icons while building each non-native file dialog, so no
+    per-dialog styling pass is needed.
+    """
+
+    # Standard pixmap -> (icon, color) for QFileDialog's toolbar buttons
+    _DIALOG_ICONS: dict[QStyle.StandardPixmap, tuple[str, str]] = {
+        QStyle.StandardPixmap.SP_ArrowBack: (
+            "file-dialog/navigate_back.svg",
+            "#7aa2f7",
+        ),
+        QStyle.StandardPixmap.SP_ArrowForward: (
+            "file-dialog/navigate_forward.svg",
+            "#7aa2f7",
+        ),
+        QStyle.StandardPixmap.SP_FileDialogToParent: (
+            "file-dialog/up_arrow.svg",
+            "#7aa2f7",
+        ),
+        QStyle.StandardPixmap.SP_FileDialogNewFolder: (
+            "file-dialog/folder_add.svg",
+            "#9ece6a",
+        ),
+        QStyle.StandardPixmap.SP_FileDialogListView: (
+            "file-dialog/list_view.svg",
+            "#7aa2f7",
+        ),
+        QStyle.StandardPixmap.SP_FileDialogDetailedView: (
+            "file-dialog/grid_view.svg",
+            "#7aa2f7",
+        ),
+    }
+
+    def standardIcon(
+        self,
+        standard_icon: QStyle.StandardPixmap,
+        option: QStyleOption | None = None,
+        widget: QWidget | None = None,
+    ) -> QIcon:
+        """Return a themed icon for file dialog toolbar buttons."""
+        spec = self._DIALOG_ICONS.get(standard_icon)
+        if spec is not None and isinstance(widget, QFileDialog):
+            icon_name, color = spec
+            return get_icon(icon_name, color=color)
+        return super().standardIcon(standard_icon, option, widget)
+
+
 class FileDialog:
     """
     Reusable file dialog with Tokyo Night styling and custom icons.
@@ -59,65 +114,6 @@ class FileDialog:
 
         return dialog
 
-    def _style_dialog(self, dialog: QFileDialog) -> None:
-        """Apply custom styling and icons to the file dialog.
-
-        Args:
-            dialog: QFileDialog instance to style
-        """
-        # Customize toolbar buttons with SVG icons
-        for widget in dialog.findChildren(QWidget):
-            if not isinstance(widget, QWidget):
-                continue
-
-            button_name: str = widget.objectName()
-
-            # Back button
-            if "backButton" in button_name or "Back" in button_name:
-                icon = get_icon("file-dialog/navigate_back.svg", color="#7aa2f7")
-                if hasattr(widget, "setIcon"):
-                    widget.setIcon(icon)
-                    widget.setToolTip("Back")
-
-            # Forward button
-            elif "forwardButton" in button_name or "Forward" in button_name:
-                icon = get_icon("file-dialog/navigate_forward.svg", color="#7aa2f7")
-                if hasattr(widget, "setIcon"):
-                    widget.setIcon(icon)
-                    widget.setToolTip("Forward")
-
-            # Parent Directory / Up button
-            elif (
-                "toParentButton" in button_name
-                or "Parent" in button_name
-                or "Up" in button_name
-            ):
-                icon = get_icon("file-dialog/up_arrow.svg", color="#7aa2f7")
-                if hasattr(widget, "setIcon"):
-                    widget.setIcon(icon)
-                    widget.setToolTip("Parent Directory")
-
-            # New Folder button
-            elif "newFolderButton" in button_name or "NewFolder" in button_name:
-                icon = get_icon("file-dialog/folder_add.svg", color="#9ece6a")
-                if hasattr(widget, "setIcon"):
-                    widget.setIcon(icon)
-                    widget.setToolTip("New Folder")
-
-            # List Mode button
-            elif "listModeButton" in button_name or "List" in button_name:
-                icon = get_icon("file-dialog/list_view.svg", color="#7aa2f7")
-                if hasattr(widget, "setIcon"):
-                    widget.setIcon(icon)
-                    widget.setToolTip("List View")
-
-            # Detail Mode button
-            elif "detailModeButton" in button_name or "Detail" in button_name:
-                icon = get_icon("file-dialog/grid_view.svg", color="#7aa2f7")
-                if hasattr(widget, "setIcon"):
-                    widget.setIcon(icon)
-                    widget.setToolTip("Detail View")
-
     def _configure_views(self, dialog: QFileDialog, multi_select: bool = False) -> None:
         """Configure list and tree views for the dialog.
 
@@ -151,6 +147,17 @@ class FileDialog:
                 header.setStretchLastSection(False)
                 header.setSectionResizeMode(0, header.ResizeMode.Interactive)
 
+    def _configure_model(self, dialog: QFileDialog) -> None:
+        """Tune the dialog's file system model for large directory trees.
+
+        Args:
+            dialog: QFileDialog instance to configure
+        """
+        model = dialog.findChild(QFileSystemModel)
+        if model:
+            # Don't install a file watcher on every directory the user expands
+            model.setOption(QFileSystemModel.Option.DontWatchForChanges, True)
+
     def get_directory(self, multi_select: bool = False) -> list[str] | None:
         """
         Open a directory selection dialog.
@@ -167,11 +174,12 @@ class FileDialog:
             | QFileDialog.ShowDirsOnly
             | QFileDialog.HideNameFilterDetails
             | QFileDialog.DontUseCustomDirectoryIcons
+            | QFileDialog.DontResolveSymlinks
         )
         dialog.setFileMode(QFileDialog.FileMode.Directory)
 
+        self._configure_model(dialog)
         self._configure_views(dialog, multi_select)
-        self._style_dialog(dialog)
 
         if dialog.exec():
             return dialog.selectedFiles()
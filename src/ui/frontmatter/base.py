@@ -29,7 +29,7 @@ from src.core import APP_NAME, FONT_FAMILY, Config
 from src.core.frontmatter_handler import (
     parse_frontmatter,
     update_frontmatter,
-    validate_field_value,
+    validate_updates,
 )
 
 # ----- UI Modules-----
@@ -195,7 +195,7 @@ class BaseFrontmatterDialog(QDialog):
         if not self.current_file_path or not self.current_file_path.exists():
             return
 
-        frontmatter, _ = parse_frontmatter(self.current_file_path)
+        frontmatter, _ = parse_frontmatter(self.current_file_path, read_body=False)
 
         # Check if frontmatter is empty
         if not frontmatter:
@@ -271,7 +271,7 @@ class BaseFrontmatterDialog(QDialog):
 
     def _validate_inputs(self) -> list[str]:
         """Validate all inputs and return list of errors."""
-        errors = []
+        values = {}
 
         for field_name, widget in self.field_widgets.items():
             # Skip hidden fields
@@ -290,11 +290,9 @@ class BaseFrontmatterDialog(QDialog):
             else:
                 continue
 
-            error = validate_field_value(field_name, value, self.note_type)
-            if error:
-                errors.append(error)
+            values[field_name] = value
 
-        return errors
+        return list(validate_updates(values, self.note_type).values())
 
     def _on_save(self) -> None:
         """Save changes to frontmatter."""
@@ -67,6 +67,7 @@ from src.utils import (
     THEME_TEXT_PRIMARY,
     HoverIconButtonSVG,
     get_icon,
+    get_icon_pixmap,
 )
 
 
@@ -226,6 +227,9 @@ class MainWindow(QMainWindow):
         # Script search dialog (lazy initialization)
         self.script_search_dialog = None
 
+        # About dialog (built on first open, then reused)
+        self.about_dialog = None
+
         # Connect to app quit signal for cleanup
         QApplication.instance().aboutToQuit.connect(self.cleanup_on_exit)
 
@@ -351,7 +355,7 @@ class MainWindow(QMainWindow):
 
         # Icon
         icon_label = QLabel()
-        icon_label.setPixmap(get_icon(icon_name).pixmap(QSize(16, 16)))
+        icon_label.setPixmap(get_icon_pixmap(icon_name, 16))
         icon_label.setFixedSize(16, 16)
         layout.addWidget(icon_label)
 
@@ -420,6 +424,9 @@ class MainWindow(QMainWindow):
             self.flask_server_thread.stop()
             self.flask_server_thread.wait(2000)  # Wait up to 2 seconds
 
+        # Stop the Node.js worker
+        self.executor.close()
+
     def setup_ui(self) -> None:
         """Setup the user interface with Blender-Launcher-inspired design."""
         central_widget = QWidget()
@@ -907,8 +914,11 @@ class MainWindow(QMainWindow):
 
     def show_about(self) -> None:
         """Show the about dialog."""
-        dialog = AboutDialog(self)
-        dialog.exec()
+        if self.about_dialog is None:
+            self.about_dialog = AboutDialog(self)
+        else:
+            self.about_dialog.center_on_parent()  # The window may have moved
+        self.about_dialog.exec()
 
     def launch_media_library(self, media_type: str = "") -> None:
         """Launch the media library in browser, filtered to media type."""
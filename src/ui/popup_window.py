@@ -23,7 +23,7 @@ from PySide6.QtWidgets import (
 from src.core.config import FONT_FAMILY
 
 # ----- Utils Modules -----
-from src.utils import get_icon
+from src.utils import get_icon_pixmap
 from src.utils.color import (
     COLOR_GREEN,
     COLOR_LIGHT_BLUE,
@@ -146,9 +146,7 @@ class PopupWindow(QDialog):
             icon_label = QLabel()
             icon_label.setScaledContents(True)
             icon_label.setFixedSize(20, 20)
-            icon_label.setPixmap(
-                get_icon(icon.value, color=self.icon_color).pixmap(20, 20)
-            )
+            icon_label.setPixmap(get_icon_pixmap(icon.value, 20, self.icon_color))
             content_layout.addWidget(icon_label)
 
         # Wrap message text manually (similar to Blender-Launcher approach)
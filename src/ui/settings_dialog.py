@@ -42,6 +42,7 @@ from src.utils import (
     disable_autostart,
     enable_autostart,
     get_icon,
+    get_icon_pixmap,
     is_autostart_enabled,
 )
 
@@ -113,9 +114,7 @@ class SettingsDialog(QDialog):
         # Obsidian icon
         vault_icon_label = QLabel()
         vault_icon_label.setPixmap(
-            get_icon(
-                "application/obsidian.svg", color=self.color_theme["border"]
-            ).pixmap(QSize(20, 20))
+            get_icon_pixmap("application/obsidian.svg", 20, self.color_theme["border"])
         )
         vault_icon_label.setFixedSize(20, 20)
         vault_path_layout.addWidget(vault_icon_label)
@@ -237,9 +236,7 @@ class SettingsDialog(QDialog):
         # Node.js icon
         nodejs_icon_label = QLabel()
         nodejs_icon_label.setPixmap(
-            get_icon("application/nodejs.svg", color=self.color_theme["border"]).pixmap(
-                QSize(20, 20)
-            )
+            get_icon_pixmap("application/nodejs.svg", 20, self.color_theme["border"])
         )
         nodejs_icon_label.setFixedSize(20, 20)
         nodejs_path_layout.addWidget(nodejs_icon_label)
@@ -248,6 +245,7 @@ class SettingsDialog(QDialog):
         self.nodejs_path_input = QLineEdit()
         self.nodejs_path_input.setProperty("MainLineEdit", True)
         self.nodejs_path_input.setPlaceholderText("node (or full path to node.exe)")
+        self.nodejs_path_input.editingFinished.connect(self._prefetch_nodejs_probe)
         nodejs_path_layout.addWidget(self.nodejs_path_input, 1)
 
         # Browse button
@@ -300,9 +298,7 @@ class SettingsDialog(QDialog):
         # Icon label using SVG
         icon_label = QLabel()
         icon_label.setPixmap(
-            get_icon("exclude.svg", color=self.color_theme["border"]).pixmap(
-                QSize(20, 20)
-            )
+            get_icon_pixmap("exclude.svg", 20, self.color_theme["border"])
         )
         icon_label.setFixedSize(20, 20)
         excluded_dirs_layout.addWidget(icon_label)
@@ -676,6 +672,7 @@ class SettingsDialog(QDialog):
         """Load current settings into the form."""
         self.vault_path_input.setText(self.config.vault_path)
         self.nodejs_path_input.setText(self.config.nodejs_path)
+        self._prefetch_nodejs_probe()
 
         # Auto-scan vault if path exists
         if self.config.vault_path and Path(self.config.vault_path).exists():
@@ -797,7 +794,7 @@ class SettingsDialog(QDialog):
             # Get relative path from vault root
             try:
                 rel_path: Path = md_file.relative_to(vault_root)
-                rel_path_str: str = str(rel_path).replace("\\", "/")
+                rel_path_str: str = rel_path.as_posix()
 
                 # Skip files in excluded directories (check both folder names and full paths)
                 should_exclude = False
@@ -844,6 +841,13 @@ class SettingsDialog(QDialog):
         )
         if path:
             self.nodejs_path_input.setText(path)
+            self._prefetch_nodejs_probe()
+
+    def _prefetch_nodejs_probe(self) -> None:
+        """Start checking the entered Node.js path so validation doesn't wait on it."""
+        nodejs_path: str = self.nodejs_path_input.text()
+        if nodejs_path:
+            self.config.probe_node_async(nodejs_path)
 
     def open_excluded_dirs_manager(self) -> None:
         """Open the excluded directories manager window."""
@@ -919,7 +923,7 @@ class SettingsDialog(QDialog):
             else self.time_path_combo.currentText()
         )
 
-        errors: list[str] = self.config.validate_paths()
+        errors: list[str] = self.config.validate_paths(check_nodejs=True)
 
         # Restore original values
         self.config.vault_path = original_vault
@@ -1026,7 +1030,7 @@ class SettingsDialog(QDialog):
             disable_autostart()
 
         if self.config.save_settings():
-            errors: list[str] = self.config.validate_paths()
+            errors: list[str] = self.config.validate_paths(check_nodejs=True)
             if errors:
                 QMessageBox.warning(
                     self,
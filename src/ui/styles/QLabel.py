@@ -122,22 +122,8 @@ def qss() -> str:
         margin-bottom: 4px;
     }}
 
-    /* === Created Label === */
-    Created {{
-        color: {THEME_TEXT_SECONDARY};
-        font-size: 9pt;
-        background: transparent;
-    }}
-
-    /* === Heart Label === */
-    #Heart {{
-        color: #f7768e;
-        font-size: 12px;
-        background: transparent;
-    }}
-
-    /* === By Label === */
-    #By {{
+    /* === Author Label === */
+    #Author {{
         color: {THEME_TEXT_SECONDARY};
         font-size: 9pt;
         background: transparent;
@@ -1,16 +1,24 @@
 # ----- Built-In Modules-----
 import importlib
 import pkgutil
+from functools import lru_cache
 
 # ----- UI Modules-----
 import src.ui.styles
 
 
+@lru_cache(maxsize=1)
 def build_stylesheet() -> str:
     """
     Dynamically imports all style modules and combines their QSS stylesheets.
     Automatically discovers new style files as the project grows.
+
+    The accent theme is fixed for the whole session, so the combined
+    stylesheet is built once on first call and reused afterwards.
     """
+    # The QSS references :/assets/... URLs, so register the Qt resources first
+    import src.resources_rc  # noqa: F401
+
     styles = []
     styles_package = src.ui.styles
     styles_path: str = styles_package.__path__[0]
@@ -1,7 +1,7 @@
 """Script card widget - entire card is clickable to execute scripts."""
 
 # ----- PySide6 Modules -----
-from PySide6.QtCore import QSize, Qt, Signal
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QMouseEvent
 from PySide6.QtWidgets import (
     QFrame,
@@ -13,7 +13,7 @@ from PySide6.QtWidgets import (
 )
 
 # ----- Utils Modules -----
-from src.utils import THEME_TEXT_PRIMARY, AccentTheme, get_icon
+from src.utils import THEME_TEXT_PRIMARY, AccentTheme, get_icon_pixmap
 
 
 class ScriptRow(QFrame):
@@ -73,7 +73,7 @@ class ScriptRow(QFrame):
 
         # Icon
         icon_label = QLabel()
-        icon_label.setPixmap(get_icon(icon_name).pixmap(QSize(14, 14)))
+        icon_label.setPixmap(get_icon_pixmap(icon_name, 14))
         icon_label.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         icon_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         name_row.addWidget(icon_label)
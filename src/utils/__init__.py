@@ -29,11 +29,12 @@ from src.utils.color import (
 )
 from src.utils.hover_button import HoverIconButtonSVG
 from src.utils.icons import Icons
-from src.utils.resources import get_icon
+from src.utils.resources import get_icon, get_icon_pixmap
 
 __all__: list[str] = [
     "Icons",
     "get_icon",
+    "get_icon_pixmap",
     "HoverIconButtonSVG",
     "enable_autostart",
     "disable_autostart",
@@ -1,5 +1,6 @@
 # ----- PySide6 Modules-----
 from PySide6.QtCore import QEvent, QSize
+from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QPushButton, QWidget
 
 # ----- Utils Modules -----
@@ -16,9 +17,11 @@ class HoverIconButtonSVG(QPushButton):
     - Pressed state: Shows pressed icon with pressed_color (if provided)
 
     Args:
-        normal_icon: SVG filename for normal state (e.g., "close.svg")
-        hover_icon: SVG filename for hover state (can be same as normal_icon)
-        pressed_icon: Optional SVG filename for pressed state (defaults to hover_icon)
+        normal_icon: SVG filename for normal state (e.g., "close.svg"), or an
+            already loaded QIcon, which is used as is and ignores normal_color
+        hover_icon: SVG filename or QIcon for hover state (can be same as normal_icon)
+        pressed_icon: Optional SVG filename or QIcon for pressed state (defaults to
+            hover_icon)
         normal_color: Hex color for normal state (e.g., "#7aa2f7")
         hover_color: Hex color for hover state (e.g., "#bb9af7")
         pressed_color: Optional hex color for pressed state (defaults to hover_color)
@@ -29,9 +32,9 @@ class HoverIconButtonSVG(QPushButton):
 
     def __init__(
         self,
-        normal_icon: str,
-        hover_icon: str,
-        pressed_icon: str = "",
+        normal_icon: QIcon | str,
+        hover_icon: QIcon | str,
+        pressed_icon: QIcon | str = "",
         normal_color: str = f"{THEME_TEXT_PRIMARY}",
         hover_color: str = f"{THEME_TEXT_SECONDARY}",
         pressed_color: str = None,
@@ -41,9 +44,13 @@ class HoverIconButtonSVG(QPushButton):
     ) -> None:
         super().__init__(text, parent)
 
-        self.normal_icon_name: str = normal_icon
-        self.hover_icon_name: str = hover_icon
-        self.pressed_icon_name: str = pressed_icon if pressed_icon else hover_icon
+        self.normal_icon_name: QIcon | str = normal_icon
+        self.hover_icon_name: QIcon | str = hover_icon
+        self.pressed_icon_name: QIcon | str = (
+            pressed_icon
+            if isinstance(pressed_icon, QIcon) or pressed_icon
+            else hover_icon
+        )
         self.normal_color: str = normal_color
         self.hover_color: str = hover_color
         self.pressed_color: str = pressed_color if pressed_color else hover_color
@@ -52,9 +59,13 @@ class HoverIconButtonSVG(QPushButton):
         self._is_pressed = False
 
         # Load icons
-        self.normal_icon = get_icon(self.normal_icon_name, color=self.normal_color)
-        self.hover_icon = get_icon(self.hover_icon_name, color=self.hover_color)
-        self.pressed_icon = get_icon(self.pressed_icon_name, color=self.pressed_color)
+        self.normal_icon: QIcon = self._load_icon(
+            self.normal_icon_name, self.normal_color
+        )
+        self.hover_icon: QIcon = self._load_icon(self.hover_icon_name, self.hover_color)
+        self.pressed_icon: QIcon = self._load_icon(
+            self.pressed_icon_name, self.pressed_color
+        )
 
         # Set initial icon
         self.setIcon(self.normal_icon)
@@ -64,6 +75,13 @@ class HoverIconButtonSVG(QPushButton):
         self.pressed.connect(self._on_pressed)
         self.released.connect(self._on_released)
 
+    @staticmethod
+    def _load_icon(icon: QIcon | str, color: str) -> QIcon:
+        """Return a ready QIcon as is, or load a filename tinted with color."""
+        if isinstance(icon, QIcon):
+            return icon
+        return get_icon(icon, color=color)
+
     def _update_icon(self) -> None:
         """Update button icon based on current state."""
         if self._is_pressed:
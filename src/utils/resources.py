@@ -6,20 +6,31 @@ Handles loading of icons and assets with PyInstaller support.
 # ----- Built-In Modules-----
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # ----- PySide6 Modules-----
-from PySide6.QtCore import QByteArray, QFile, QIODevice, Qt
+from PySide6.QtCore import QByteArray, QFile, QIODevice, QSize, Qt
 from PySide6.QtGui import QIcon, QPainter, QPixmap
 from PySide6.QtSvg import QSvgRenderer
 
-# ----- Resources-----
-import src.resources_rc  # noqa: F401
 
-try:
-    USE_QT_RESOURCES = True
-except ImportError:
-    USE_QT_RESOURCES = False
+@lru_cache(maxsize=1)
+def _use_qt_resources() -> bool:
+    """
+    Register the compiled Qt resources on first use.
+
+    Importing resources_rc copies every asset into Qt's resource system, so
+    it is deferred until a resource is actually requested.
+
+    Returns:
+        True if the Qt resources are available
+    """
+    try:
+        import src.resources_rc  # noqa: F401
+    except ImportError:
+        return False
+    return True
 
 
 def get_resource_path(relative_path: str) -> str:
@@ -33,7 +44,7 @@ def get_resource_path(relative_path: str) -> str:
         Path to resource (Qt resource path or file path)
     """
     # If Qt resources are available, use them
-    if USE_QT_RESOURCES:
+    if _use_qt_resources():
         qt_path: str = f":/{relative_path}"
         # Check if resource exists in Qt resource system
         if QFile.exists(qt_path):
@@ -51,10 +62,14 @@ def get_resource_path(relative_path: str) -> str:
     return str(base_path / relative_path)
 
 
+@lru_cache(maxsize=128)
 def get_icon(icon_name: str, color: str = None) -> QIcon:
     """
     Load an icon from the assets directory, optionally recoloring SVG icons.
 
+    Results are cached per (icon_name, color), so repeated lookups reuse the
+    already rendered QIcon instead of re-parsing the SVG.
+
     Args:
         icon_name: Icon filename (e.g., 'obsidian-forge.ico')
         color: Hex color to apply to SVG icons (e.g., '#c0caf5')
@@ -139,6 +154,35 @@ def get_icon(icon_name: str, color: str = None) -> QIcon:
     return icon
 
 
+@lru_cache(maxsize=128)
+def get_icon_pixmap(
+    icon_name: str, size: int, color: str = None, device_pixel_ratio: float = None
+) -> QPixmap:
+    """
+    Render an icon to a square pixmap, cached per (icon_name, size, color, ratio).
+
+    Labels showing the same icon at the same size share one rendered pixmap
+    across every dialog instead of rasterizing the icon again.
+
+    Args:
+        icon_name: Icon filename (e.g., 'file.svg')
+        size: Width and height in logical pixels
+        color: Hex color to apply to SVG icons (e.g., '#c0caf5')
+        device_pixel_ratio: Screen scale to rasterize for (e.g., the showing
+            widget's devicePixelRatioF()), defaults to the application's
+
+    Returns:
+        QPixmap object
+    """
+    icon: QIcon = get_icon(icon_name, color)
+    if device_pixel_ratio is None:
+        return icon.pixmap(QSize(size, size))
+
+    # Rendered at physical size and tagged with the ratio, so it stays sharp
+    # on fractional scaling without being rescaled at paint time
+    return icon.pixmap(QSize(size, size), device_pixel_ratio)
+
+
 def get_pixmap(image_name: str) -> QPixmap:
     """
     Load a pixmap from the assets directory.
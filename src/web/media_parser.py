@@ -8,7 +8,9 @@ from typing import Dict, List, Union
 import sys
 
 # Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_SRC_DIR = str(Path(__file__).parent.parent)
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 from core.config import Config
 from web.parsers import (
@@ -12,7 +12,9 @@ import sys
 import re
 
 # Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+_SRC_DIR = str(Path(__file__).parent.parent.parent)
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 from core.frontmatter_handler import parse_frontmatter
 
@@ -49,7 +51,7 @@ def parse_documentary(file_path: Path) -> Optional[Documentary]:
         Documentary object or None if parsing fails
     """
     try:
-        frontmatter, _ = parse_frontmatter(file_path)
+        frontmatter, _ = parse_frontmatter(file_path, read_body=False)
 
         if not frontmatter:
             print(f"Warning: No frontmatter found in {file_path}")
@@ -7,7 +7,9 @@ from pathlib import Path
 import sys
 
 # Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_SRC_DIR = str(Path(__file__).parent.parent)
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 from core.config import Config
 from web.media_parser import get_all_media_items, parse_media_file
@@ -18,6 +20,23 @@ api_bp = Blueprint("api", __name__)
 main_bp = Blueprint("main", __name__)
 
 
+def _media_config() -> Config:
+    """
+    Get the shared Config with the latest saved settings for this server's vault.
+
+    Settings saved in the app since the last request (e.g. custom media paths)
+    are picked up here, without re-reading settings.json on every request.
+    """
+    config = Config()
+    config.reload_if_changed()
+
+    # Media paths are resolved against the vault the server was started for
+    vault_path = current_app.config["VAULT_PATH"]
+    if config.vault_path != vault_path:
+        config.vault_path = vault_path
+    return config
+
+
 @main_bp.route("/")
 def index():
     """Serve the main HTML page."""
@@ -36,9 +55,7 @@ def get_media():
         JSON object with media items organized by type
     """
     try:
-        # Create config from stored vault path
-        config = Config()
-        config.vault_path = current_app.config["VAULT_PATH"]
+        config = _media_config()
 
         # Get all media items
         media_data = get_all_media_items(config)
@@ -132,8 +149,7 @@ def get_media_detail(media_type, item_id):
         JSON object with full media item details
     """
     try:
-        config = Config()
-        config.vault_path = current_app.config["VAULT_PATH"]
+        config = _media_config()
 
         # Get the appropriate directory path
         if media_type == "books":
@@ -197,9 +213,8 @@ def open_in_obsidian(media_type, item_id):
         JSON object with Obsidian URI
     """
     try:
-        config = Config()
+        config = _media_config()
         vault_path = current_app.config["VAULT_PATH"]
-        config.vault_path = vault_path
 
         # Get the appropriate directory path
         if media_type == "books":